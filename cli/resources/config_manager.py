@@ -132,6 +132,12 @@ class ConfigManager:
             except (TypeError, ValueError):
                 raise ValueError(f"Invalid SSH port value in config: {self.config['ssh']['port']}")
 
+        # Default SSH backend
+        if "backend" not in self.config["ssh"]:
+            self.config["ssh"]["backend"] = "ssh"
+        elif self.config["ssh"]["backend"] not in ["ssh", "paramiko"]:
+            raise ValueError(f"Invalid SSH backend: {self.config['ssh']['backend']}. Must be 'ssh' or 'paramiko'.")
+
         # Default database filename
         if "db_filename" not in self.config["paths"]:
             self.config["paths"]["db_filename"] = "wordpress-sync-database.sql"
@@ -144,7 +150,10 @@ class ConfigManager:
             "delete": True,
             "progress": True,
             "verbose": True,
+            "force_progress": False,
             "compress": True,
+            "whole_file": "auto",
+            "parallel_workers": 1,
             "chmod_files": "664",
             "chmod_dirs": "775",
             "excludes": [".DS_Store", "wp-config.php"]
@@ -159,6 +168,31 @@ class ConfigManager:
         elif "enabled" not in self.config["validation"]:
             self.config["validation"]["enabled"] = True
 
+        # Default database transfer settings
+        if "database" not in self.config:
+            self.config["database"] = {}
+        if "compression" not in self.config["database"]:
+            self.config["database"]["compression"] = "auto"
+        elif self.config["database"]["compression"] not in ["auto", "zstd", "gzip", "none"]:
+            raise ValueError(f"Invalid database compression: {self.config['database']['compression']}. Must be 'auto', 'zstd', 'gzip' or 'none'.")
+        if "dumper" not in self.config["database"]:
+            self.config["database"]["dumper"] = "wp"
+        if "export_flags" not in self.config["database"]:
+            self.config["database"]["export_flags"] = [
+                "--single-transaction",
+                "--quick",
+                "--extended-insert",
+                "--default-character-set=utf8mb4"
+            ]
+        if "exclude_tables" not in self.config["database"]:
+            self.config["database"]["exclude_tables"] = []
+
+        # Default maintenance mode settings
+        if "maintenance" not in self.config:
+            self.config["maintenance"] = {}
+        if "include_source" not in self.config["maintenance"]:
+            self.config["maintenance"]["include_source"] = False
+
         # Default ownership settings
         if "ownership" not in self.config:
             if "user" in self.config["ssh"]:
@@ -6,12 +6,81 @@ This module handles database operations such as export, import, and reset using
 It manages the WordPress database operations during the synchronization process.
 """
 
+import json
+import logging
 import os
+import shutil
 import subprocess
 import sys
 import shlex
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from resources.ssh_manager import SSHManager
+from resources.wp_cli import WP_BIN
+
+logger = logging.getLogger(__name__)
+
+# Compressors for dumps streamed over SSH: name -> (compress argv, decompress argv).
+# SQL dumps compress 6-10x and these levels outrun a single network link.
+COMPRESSORS = {
+    "zstd": (["zstd", "-3", "--long", "-q", "-c"], ["zstd", "-d", "--long=27", "-q", "-c"]),
+    "gzip": (["gzip", "-1", "-c"], ["gzip", "-d", "-c"]),
+}
+
+# Passed through to mysqldump by every 'wp db export' unless database.export_flags overrides them
+DEFAULT_EXPORT_FLAGS = [
+    "--single-transaction",
+    "--quick",
+    "--extended-insert",
+    "--default-character-set=utf8mb4",
+]
+
+# Bulk-load settings applied ahead of a streamed import, which is then committed once
+IMPORT_PREAMBLE = "SET autocommit=0; SET unique_checks=0; SET foreign_key_checks=0;"
+
+
+def _resolve_path(base_path, user_path, suffix=""):
+    """
+    Resolve a configured directory against a WordPress root.
+
+    Absolute paths are used as-is, '../' paths are taken relative to the
+    parent of the WordPress root, and other relative paths are joined to it.
+
+    Args:
+        base_path (str): WordPress root the relative forms are resolved against.
+        user_path (str): Configured path.
+        suffix (str): Optional subdirectory appended to the resolved path.
+
+    Returns:
+        str: Resolved path.
+    """
+    if os.path.isabs(user_path):
+        resolved = user_path
+    elif user_path.startswith('../'):
+        resolved = os.path.join(os.path.dirname(base_path.rstrip('/')), user_path[3:])
+    else:
+        resolved = os.path.join(base_path, user_path)
+    return os.path.join(resolved, suffix) if suffix else resolved
+
+
+def _pipe_with_status(producer, consumer):
+    """
+    Join two shell commands with a pipe, failing if either side fails.
+
+    POSIX sh has no pipefail, so the producer's exit code is passed out
+    through fd 3 and re-raised once the pipeline has drained; a failing
+    consumer exits with its own status first.
+
+    Args:
+        producer (str): Command writing to the pipe.
+        consumer (str): Command reading from the pipe.
+
+    Returns:
+        str: Shell snippet running the pipeline.
+    """
+    return f"exec 4>&1; rc=$( {{ {{ {producer}; echo $? >&3; }} | {consumer} >&4; }} 3>&1 ) || exit $?; exit $rc"
 
 
 class DatabaseManager:
@@ -39,11 +108,73 @@ class DatabaseManager:
         self.db_temp = self.db_temp_local
         self.db_filename = config["paths"].get("db_filename", "wordpress-sync-database.sql")
         
-        # Get the correct local temp directory path
-        local_db_temp = self._get_local_db_temp_path()
+        # Extra 'wp db export' arguments: mysqldump flags and excluded tables. Safety
+        # backups taken before a reset skip the exclusions, so they can fully restore
+        # the database they are taken of
+        database_config = config.get("database", {})
+        self._backup_export_args = list(database_config.get("export_flags", DEFAULT_EXPORT_FLAGS))
+        self._export_args = list(self._backup_export_args)
+        exclude_tables = database_config.get("exclude_tables", [])
+        if exclude_tables:
+            self._export_args.append(f"--exclude_tables={','.join(exclude_tables)}")
+        
+        # Compressor for streamed dumps, resolved on first use
+        self._compression = None
+        
+        # Shared SSH manager, created on first remote call
+        self._ssh_manager = None
+        
+        # Pre-reset backup state: the user's answer and whether the backup already ran
+        self._backup_decision = None
+        self._backup_attempted = False
+        
+        # Results of the environment checks, which don't change during a run
+        self._wp_cli_ok = None
+        self._wp_installed = {}
+        
+        # Resolve temp and backup directories once; they only depend on config
+        self._local_db_temp = _resolve_path(self.local_path, self.db_temp_local)
+        self._remote_db_temp = _resolve_path(self.live_path, self.db_temp_remote)
+        self._backup_dirs = {}
         
         # Ensure temp directory exists
-        os.makedirs(local_db_temp, exist_ok=True)
+        os.makedirs(self._local_db_temp, exist_ok=True)
+
+    def _ssh(self):
+        """
+        Get the SSH manager shared by all remote database operations.
+
+        Returns:
+            SSHManager: SSH manager instance.
+        """
+        if self._ssh_manager is None:
+            self._ssh_manager = SSHManager(self.config)
+        return self._ssh_manager
+
+    def _run_local(self, cmd):
+        """
+        Run a local command, forwarding its stderr as it is produced.
+
+        stdout is discarded since none of the WP-CLI calls made here read it,
+        and a long import can print a lot of it.
+
+        Args:
+            cmd (list): Command and arguments.
+
+        Returns:
+            int: Exit code of the command.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        for line in process.stderr:
+            logger.info(line.rstrip())
+        process.stderr.close()
+        return process.wait()
 
     def check_wp_cli(self):
         """
@@ -52,22 +183,25 @@ class DatabaseManager:
         Returns:
             bool: True if WP-CLI is installed, False otherwise.
         """
+        if self._wp_cli_ok is not None:
+            return self._wp_cli_ok
+            
         try:
             result = subprocess.run(
-                ["wp", "--info"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                [WP_BIN, "--info"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False
             )
             
-            return result.returncode == 0
+            self._wp_cli_ok = result.returncode == 0
+            return self._wp_cli_ok
             
         except FileNotFoundError:
-            print("WordPress CLI (wp) not found. Please install it and make sure it's in your PATH.")
+            logger.info("WordPress CLI (wp) not found. Please install it and make sure it's in your PATH.")
             return False
         except Exception as e:
-            print(f"Error checking WordPress CLI: {e}")
+            logger.error(f"Error checking WordPress CLI: {e}")
             return False
 
     def check_wordpress_installed(self, direction):
@@ -82,22 +216,19 @@ class DatabaseManager:
         """
         # Skip WordPress installation check if environment variable is set
         if os.environ.get('WORDPRESS_SYNC_SKIP_WP_CHECK', '').lower() in ('true', '1', 'yes'):
-            print(f"Skipping WordPress installation check (WORDPRESS_SYNC_SKIP_WP_CHECK=true)")
+            logger.info(f"Skipping WordPress installation check (WORDPRESS_SYNC_SKIP_WP_CHECK=true)")
             return True
             
-        print("Checking WordPress installations...")
+        logger.info("Checking WordPress installations...")
         
-        # Check local WordPress installation
-        local_installed = self._check_wp_installed(self.local_path, is_remote=False)
-        if not local_installed:
-            return False
-            
-        # Check remote WordPress installation
-        remote_installed = self._check_wp_installed(self.live_path, is_remote=True)
-        if not remote_installed:
-            return False
+        # Check local and remote WordPress installations, reusing earlier results
+        for path, is_remote in ((self.local_path, False), (self.live_path, True)):
+            if (path, is_remote) not in self._wp_installed:
+                self._wp_installed[(path, is_remote)] = self._check_wp_installed(path, is_remote=is_remote)
+            if not self._wp_installed[(path, is_remote)]:
+                return False
             
-        print("WordPress is properly installed in both environments.")
+        logger.info("WordPress is properly installed in both environments.")
         return True
 
     def _check_wp_installed(self, path, is_remote=False):
@@ -113,99 +244,70 @@ class DatabaseManager:
         """
         # Add an environment variable option to skip the check
         if os.environ.get('WORDPRESS_SYNC_SKIP_WP_CHECK', '').lower() in ('true', '1', 'yes'):
-            print(f"Skipping WordPress installation check (WORDPRESS_SYNC_SKIP_WP_CHECK=true)")
+            logger.info(f"Skipping WordPress installation check (WORDPRESS_SYNC_SKIP_WP_CHECK=true)")
             return True
             
-        print(f"Checking WordPress installation at: {path}")
+        logger.info(f"Checking WordPress installation at: {path}")
         
         # First check if the directory exists
         if not is_remote and not os.path.isdir(path):
-            print(f"Error: Directory does not exist: {path}")
+            logger.error(f"Error: Directory does not exist: {path}")
             return False
             
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
-            
-            # Check if directory exists on remote server
-            dir_check_cmd = f"[ -d \"{path}\" ] && echo 'exists' || echo 'not found'"
-            success, output = ssh_manager.execute_remote_command(dir_check_cmd)
-            if not success or 'not found' in output:
-                print(f"Error: Remote directory does not exist: {path}")
+            ssh_manager = self._ssh()
+            
+            # Run the directory, wp-config.php and 'wp core is-installed' checks
+            # in a single SSH call; the script prints one status token at the end.
+            logger.info(f"Running 'wp core is-installed' on remote server...")
+            check_cmd = (
+                f'if [ ! -d "{path}" ]; then echo "missing-dir"; '
+                f'elif [ ! -f "{path}/wp-config.php" ]; then echo "missing-config"; '
+                f'elif wp --path="{path}" core is-installed --allow-root 2>&1; then echo "installed"; '
+                f'else echo "not-installed"; fi'
+            )
+            success, output = ssh_manager.execute_remote_command(check_cmd)
+            lines = output.strip().splitlines() if success else []
+            status = lines[-1] if lines else "not-installed"
+            
+            if status == "missing-dir":
+                logger.error(f"Error: Remote directory does not exist: {path}")
                 return False
                 
-            # Check if wp-config.php exists (basic check for WordPress installation)
-            config_check_cmd = f"[ -f \"{path}/wp-config.php\" ] && echo 'exists' || echo 'not found'"
-            success, output = ssh_manager.execute_remote_command(config_check_cmd)
-            if not success or 'not found' in output:
-                print(f"Error: wp-config.php not found in remote directory: {path}")
+            if status == "missing-config":
+                logger.error(f"Error: wp-config.php not found in remote directory: {path}")
                 return False
                 
-            # Try the WP-CLI command
-            print(f"Running 'wp core is-installed' on remote server...")
-            cmd = f'wp --path="{path}" core is-installed'
-            success, output = ssh_manager.execute_remote_command(cmd)
-            
-            # If it fails, try with --allow-root
-            if not success:
-                print(f"Trying with --allow-root flag...")
-                cmd = f'wp --path="{path}" core is-installed --allow-root'
-                success, output = ssh_manager.execute_remote_command(cmd)
-                
+            success = status == "installed"
             if success:
-                print(f"WordPress is installed at remote path: {path}")
+                logger.info(f"WordPress is installed at remote path: {path}")
             else:
-                print(f"WordPress is not installed at remote path: {path}")
-                if output:
-                    print(f"Error output: {output}")
+                logger.info(f"WordPress is not installed at remote path: {path}")
+                error_output = "\n".join(lines[:-1]) if lines else output
+                if error_output:
+                    logger.error(f"Error output: {error_output}")
                     
             return success
         else:
             try:
                 # Check if wp-config.php exists (basic check for WordPress installation)
                 if not os.path.isfile(os.path.join(path, 'wp-config.php')):
-                    print(f"Error: wp-config.php not found in directory: {path}")
+                    logger.error(f"Error: wp-config.php not found in directory: {path}")
                     return False
                     
-                # Try without --allow-root flag first
-                print(f"Running 'wp core is-installed'...")
-                # Use a single string command with shell=True to ensure proper path handling
-                cmd = f'wp --path="{path}" core is-installed'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                # If it fails, try with --allow-root flag
-                if result.returncode != 0:
-                    print(f"Trying with --allow-root flag...")
-                    cmd = f'wp --path="{path}" core is-installed --allow-root'
-                    result = subprocess.run(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=False,
-                        shell=True
-                    )
-                
-                is_installed = result.returncode == 0
+                logger.info(f"Running 'wp core is-installed'...")
+                cmd = [WP_BIN, f"--path={path}", "core", "is-installed", "--allow-root"]
+                is_installed = self._run_local(cmd) == 0
                 
                 if is_installed:
-                    print(f"WordPress is installed at local path: {path}")
+                    logger.info(f"WordPress is installed at local path: {path}")
                 else:
-                    print(f"WordPress is not installed at local path: {path}")
-                    if result.stderr:
-                        print(f"Error output: {result.stderr}")
+                    logger.info(f"WordPress is not installed at local path: {path}")
                         
                 return is_installed
                 
             except Exception as e:
-                print(f"Error checking WordPress installation: {e}")
+                logger.error(f"Error checking WordPress installation: {e}")
                 return False
 
     def _get_local_db_temp_path(self):
@@ -215,23 +317,7 @@ class DatabaseManager:
         Returns:
             str: Path to the local temporary database directory.
         """
-        db_temp = self.db_temp_local
-        
-        # If db_temp is an absolute path, use it directly
-        if os.path.isabs(db_temp):
-            return db_temp
-            
-        # For relative paths that start with ../
-        if db_temp.startswith('../'):
-            # Get the parent directory of the WordPress directory
-            parent_dir = os.path.dirname(self.local_path.rstrip('/'))
-            # Remove the ../ prefix from db_temp
-            relative_path = db_temp[3:]
-            # Join the parent directory with the remaining path
-            return os.path.join(parent_dir, relative_path)
-        
-        # For other relative paths, join with local_path
-        return os.path.join(self.local_path, db_temp)
+        return self._local_db_temp
             
     def _get_remote_db_temp_path(self):
         """
@@ -240,24 +326,153 @@ class DatabaseManager:
         Returns:
             str: Path to the remote temporary database directory.
         """
-        db_temp = self.db_temp_remote
-        
-        # If db_temp is an absolute path, use it directly
-        if os.path.isabs(db_temp):
-            return db_temp
-            
-        # For relative paths that start with ../
-        if db_temp.startswith('../'):
-            # Get the parent directory of the WordPress directory
-            parent_dir = os.path.dirname(self.live_path.rstrip('/'))
-            # Remove the ../ prefix from db_temp
-            relative_path = db_temp[3:]
-            # Join the parent directory with the remaining path
-            return os.path.join(parent_dir, relative_path)
-        
-        # For other relative paths, join with live_path
-        return os.path.join(self.live_path, db_temp)
+        return self._remote_db_temp
         
+    def get_export_args(self):
+        """
+        Get the extra arguments appended to the 'wp db export' of a sync.
+
+        Returns:
+            list: mysqldump flags and the --exclude_tables option, if any.
+        """
+        return self._export_args
+
+    def get_backup_export_args(self):
+        """
+        Get the extra arguments appended to the 'wp db export' of a safety backup.
+
+        Returns:
+            list: mysqldump flags, without any table exclusions.
+        """
+        return self._backup_export_args
+
+    def get_remote_export_command(self, source_path, compress_args=None):
+        """
+        Build the remote command that writes a dump to stdout.
+
+        Args:
+            source_path (str): WordPress path on the remote server.
+            compress_args (list): Remote compressor, or None for a plain dump.
+
+        Returns:
+            str: Shell command to run on the remote server.
+        """
+        export_args = " ".join(shlex.quote(arg) for arg in self._export_args)
+        export_cmd = f'wp --path="{source_path}" db export - {export_args} --allow-root'
+        if compress_args:
+            return _pipe_with_status(export_cmd, " ".join(compress_args))
+        return export_cmd
+
+    def get_remote_import_command(self, target_path, decompress_args=None):
+        """
+        Build the remote command that imports a dump streamed on stdin.
+
+        WP-CLI only wraps file imports in a single transaction with checks
+        disabled, so the stream gets the same preamble. COMMIT is only sent
+        once the dump was read in full (the bare echo guards against a dump
+        without a trailing newline swallowing it), and the command exits with
+        the reader's status, so a failed decompress fails the import instead
+        of committing a partial database.
+
+        Args:
+            target_path (str): WordPress path on the remote server.
+            decompress_args (list): Remote decompressor, or None for a plain dump.
+
+        Returns:
+            str: Shell command to run on the remote server.
+        """
+        import_cmd = f'wp --path="{target_path}" db import - --allow-root'
+        read_cmd = " ".join(decompress_args) if decompress_args else "cat"
+        producer = f'echo "{IMPORT_PREAMBLE}" && {read_cmd} && {{ echo; echo "COMMIT;"; }}'
+        return _pipe_with_status(producer, import_cmd)
+
+    def get_stream_import_command(self, db_file, target_path, ssh_argv):
+        """
+        Build the local command that streams a dump into the remote database.
+
+        Only used to show the command; the configured compression is used as-is
+        (gzip for 'auto'), without probing the remote server for zstd.
+
+        Args:
+            db_file (str): Local dump file.
+            target_path (str): WordPress path on the remote server.
+            ssh_argv (list): ssh command line up to and including the target.
+
+        Returns:
+            str: Shell command to run locally.
+        """
+        compression = self._get_configured_compression()
+        remote_cmd = self.get_remote_import_command(target_path, compression[1] if compression else None)
+        ssh_cmd = shlex.join([*ssh_argv, remote_cmd])
+        if compression:
+            return f"{shlex.join(compression[0])} < {shlex.quote(db_file)} | {ssh_cmd}"
+        return f"{ssh_cmd} < {shlex.quote(db_file)}"
+
+    def get_stream_export_command(self, db_file, source_path, ssh_argv):
+        """
+        Build the local command that streams a remote dump into a local file.
+
+        Only used to show the command; the configured compression is used as-is
+        (gzip for 'auto'), without probing the remote server for zstd.
+
+        Args:
+            db_file (str): Local file to write the dump to.
+            source_path (str): WordPress path on the remote server.
+            ssh_argv (list): ssh command line up to and including the target.
+
+        Returns:
+            str: Shell command to run locally.
+        """
+        compression = self._get_configured_compression()
+        remote_cmd = self.get_remote_export_command(source_path, compression[0] if compression else None)
+        ssh_cmd = shlex.join([*ssh_argv, remote_cmd])
+        if compression:
+            return f"{ssh_cmd} | {shlex.join(compression[1])} > {shlex.quote(db_file)}"
+        return f"{ssh_cmd} > {shlex.quote(db_file)}"
+
+    def _get_configured_compression(self):
+        """
+        Get the compressor named by database.compression, without any probing.
+
+        Returns:
+            tuple: (compress_args, decompress_args), or None if compression is disabled.
+        """
+        mode = self.config.get("database", {}).get("compression", "auto")
+        if mode == "none":
+            return None
+        return COMPRESSORS.get(mode, COMPRESSORS["gzip"])
+
+    def _get_compression(self):
+        """
+        Get the compressor used for database dumps streamed over SSH.
+
+        Controlled by database.compression ('auto', 'zstd', 'gzip' or 'none').
+        In 'auto' mode zstd is used when it is installed on both ends, gzip
+        otherwise. The result is cached for the lifetime of the manager.
+
+        Returns:
+            tuple: (compress_args, decompress_args), or None if compression is disabled.
+        """
+        if self._compression is not None:
+            return self._compression or None
+            
+        mode = self.config.get("database", {}).get("compression", "auto")
+        if mode == "none":
+            self._compression = ()
+            return None
+            
+        name = mode if mode in COMPRESSORS else "gzip"
+        if mode == "auto" and shutil.which("zstd"):
+            ssh_manager = self._ssh()
+            
+            probe_cmd = "command -v zstd >/dev/null 2>&1 && echo 'found' || echo 'not found'"
+            success, output = ssh_manager.execute_remote_command(probe_cmd)
+            if success and output.strip() == "found":
+                name = "zstd"
+                
+        self._compression = COMPRESSORS[name]
+        return self._compression
+
     def _get_db_backup_path(self, is_remote=False):
         """
         Get the path for database backups.
@@ -280,40 +495,28 @@ class DatabaseManager:
         timestamp = time.strftime(filename_format.replace(".sql", ""))
         backup_filename = f"{timestamp}.sql"
         
-        # Determine base path based on whether it's remote or local
-        base_path = self.live_path if is_remote else self.local_path
+        # The directory only depends on config, so resolve it once per side
+        full_backup_dir = self._backup_dirs.get(is_remote)
+        if full_backup_dir is None:
+            # Determine base path based on whether it's remote or local
+            base_path = self.live_path if is_remote else self.local_path
         
-        # Check if using new unified backup directory format
-        raw_dir = self.config.get("backup", {}).get("directory")
-        if isinstance(raw_dir, dict):
-            # New format: DB backups go in <backup_root>/db/
-            dir_key = "remote" if is_remote else "local"
-            root_dir = raw_dir.get(dir_key, "../wordpress-sync-backups")
-            
-            # Resolve relative path
-            if os.path.isabs(root_dir):
-                full_backup_dir = os.path.join(root_dir, "db")
-            elif root_dir.startswith('../'):
-                parent_dir = os.path.dirname(base_path.rstrip('/'))
-                full_backup_dir = os.path.join(parent_dir, root_dir[3:], "db")
-            else:
-                full_backup_dir = os.path.join(base_path.rstrip('/'), root_dir, "db")
-        else:
-            # Old format: use separate backup.database.directory
-            if "backup" not in self.config or "database" not in self.config["backup"]:
-                backup_dir = "../wordpress-sync-db-backups"
+            # Check if using new unified backup directory format
+            raw_dir = self.config.get("backup", {}).get("directory")
+            if isinstance(raw_dir, dict):
+                # New format: DB backups go in <backup_root>/db/
+                dir_key = "remote" if is_remote else "local"
+                root_dir = raw_dir.get(dir_key, "../wordpress-sync-backups")
+                full_backup_dir = _resolve_path(base_path, root_dir, "db")
             else:
-                backup_dir = self.config["backup"]["database"].get("directory", "../wordpress-sync-db-backups")
-            
-            # Resolve the full backup directory path
-            if os.path.isabs(backup_dir):
-                full_backup_dir = backup_dir
-            elif backup_dir.startswith('../'):
-                parent_dir = os.path.dirname(base_path.rstrip('/'))
-                relative_path = backup_dir[3:]
-                full_backup_dir = os.path.join(parent_dir, relative_path)
-            else:
-                full_backup_dir = os.path.join(base_path, backup_dir)
+                # Old format: use separate backup.database.directory
+                if "backup" not in self.config or "database" not in self.config["backup"]:
+                    backup_dir = "../wordpress-sync-db-backups"
+                else:
+                    backup_dir = self.config["backup"]["database"].get("directory", "../wordpress-sync-db-backups")
+                full_backup_dir = _resolve_path(base_path, backup_dir)
+                
+            self._backup_dirs[is_remote] = full_backup_dir
             
         return full_backup_dir, backup_filename
         
@@ -342,53 +545,39 @@ class DatabaseManager:
         backup_file = os.path.join(backup_dir, backup_filename)
         
         if dry_run:
-            print(f"[DRY RUN] Would backup database at {target_path} to {backup_file}")
+            logger.info(f"[DRY RUN] Would backup database at {target_path} to {backup_file}")
             return backup_file
             
         # Ensure backup directory exists
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            ssh_manager = self._ssh()
             
-            mkdir_cmd = f"mkdir -p {backup_dir}"
-            success, _ = ssh_manager.execute_remote_command(mkdir_cmd)
-            if not success:
-                print(f"Failed to create backup directory on remote server: {backup_dir}")
-                return None
-                
-            # Export database to backup file
-            export_cmd = f'wp --path="{target_path}" db export {backup_file} --allow-root'
+            # Create the backup directory and export in a single SSH call
+            export_args = " ".join(shlex.quote(arg) for arg in self._backup_export_args)
+            export_cmd = f'mkdir -p "{backup_dir}" && wp --path="{target_path}" db export "{backup_file}" {export_args} --allow-root'
             success, output = ssh_manager.execute_remote_command(export_cmd)
             
             if not success:
-                print(f"Failed to backup remote database: {output}")
+                logger.error(f"Failed to backup remote database: {output}")
                 return None
                 
-            print(f"Database backed up to {backup_file} on remote server")
+            logger.info(f"Database backed up to {backup_file} on remote server")
         else:
             # Ensure local backup directory exists
             os.makedirs(backup_dir, exist_ok=True)
             
             try:
                 # Export database to backup file
-                cmd = f'wp --path="{target_path}" db export {backup_file} --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to backup local database: {result.stderr}")
+                cmd = [WP_BIN, f"--path={target_path}", "db", "export", backup_file, *self._backup_export_args, "--allow-root"]
+                returncode = self._run_local(cmd)
+                if returncode != 0:
+                    logger.error(f"Failed to backup local database (exit code {returncode})")
                     return None
                     
-                print(f"Database backed up to {backup_file}")
+                logger.info(f"Database backed up to {backup_file}")
                 
             except Exception as e:
-                print(f"Error backing up database: {e}")
+                logger.error(f"Error backing up database: {e}")
                 return None
                 
         return backup_file
@@ -407,81 +596,223 @@ class DatabaseManager:
         if direction == "push":
             # Export from local
             source_path = self.local_path
-            # Get the correct local temp directory path
-            local_db_temp = self._get_local_db_temp_path()
-            db_file = os.path.join(local_db_temp, self.db_filename)
             is_remote = False
         else:  # pull
-            # Export from remote
+            # Export from remote, streamed straight into the local temp directory
             source_path = self.live_path
-            # Get the correct remote temp directory path
-            remote_db_temp = self._get_remote_db_temp_path()
-            db_file = os.path.join(remote_db_temp, self.db_filename)
             is_remote = True
-            
-            # Ensure remote db_temp directory exists
-            if not dry_run:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                mkdir_cmd = f"mkdir -p {remote_db_temp}"
-                ssh_manager.execute_remote_command(mkdir_cmd)
+
+        # The dump always lands in the local temp directory
+        local_db_temp = self._get_local_db_temp_path()
+        db_file = os.path.join(local_db_temp, self.db_filename)
 
         if dry_run:
-            print(f"[DRY RUN] Would export database from {source_path} to {db_file}")
+            logger.info(f"[DRY RUN] Would export database from {source_path} to {db_file}")
             return db_file
 
         # Export database
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
-            
-            export_cmd = f'wp --path="{source_path}" db export {db_file} --allow-root'
-            success, output = ssh_manager.execute_remote_command(export_cmd)
-            
+            # On pull the local pre-reset backup doesn't depend on the remote
+            # dump, so run it alongside the export instead of before the import
+            if self._should_backup(direction):
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    backup_future = executor.submit(self._backup_before_reset, direction)
+                    success, output = self._stream_remote_export(source_path, db_file)
+                    backup_future.result()
+            else:
+                success, output = self._stream_remote_export(source_path, db_file)
+                
             if not success:
-                print(f"Failed to export remote database: {output}")
+                logger.error(f"Failed to export remote database: {output}")
                 return None
                 
-            print(f"Database exported to {db_file} on remote server")
+            logger.info(f"Database exported from remote server to {db_file}")
         else:
+            # Optional parallel dump; falls back to 'wp db export' if it is unavailable or fails
+            dumper = self.config.get("database", {}).get("dumper", "wp")
+            if dumper == "mydumper":
+                if not shutil.which("mydumper"):
+                    logger.info("mydumper not found, falling back to 'wp db export'")
+                elif self._export_with_mydumper(source_path, db_file):
+                    logger.info(f"Database exported to {db_file}")
+                    return db_file
+                else:
+                    logger.info("mydumper export failed, falling back to 'wp db export'")
+                    
             try:
-                cmd = f'wp --path="{source_path}" db export {db_file} --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to export local database: {result.stderr}")
+                cmd = [WP_BIN, f"--path={source_path}", "db", "export", db_file, *self._export_args, "--allow-root"]
+                returncode = self._run_local(cmd)
+                if returncode != 0:
+                    logger.error(f"Failed to export local database (exit code {returncode})")
                     return None
                     
-                print(f"Database exported to {db_file}")
+                logger.info(f"Database exported to {db_file}")
                 
             except Exception as e:
-                print(f"Error exporting database: {e}")
+                logger.error(f"Error exporting database: {e}")
                 return None
 
-        # If pulling, transfer the database file from remote to local
-        if direction == "pull" and not dry_run:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
-            
-            # Get the correct local temp directory path
-            local_db_temp = self._get_local_db_temp_path()
-            local_db_file = os.path.join(local_db_temp, self.db_filename)
-            success = ssh_manager.transfer_file(db_file, local_db_file, "pull")
+        return db_file
+
+    def _stream_remote_export(self, source_path, db_file):
+        """
+        Stream a remote database dump into a local file over SSH.
+
+        Args:
+            source_path (str): Path to the remote WordPress installation.
+            db_file (str): Local file to write the dump to.
+
+        Returns:
+            tuple: (success, output) where output is the error output on failure.
+        """
+        ssh_manager = self._ssh()
+        
+        # 'db export -' writes the SQL to stdout, so the dump is piped over
+        # the SSH channel without a remote temp file or a separate scp pass.
+        # It is compressed on the remote end and inflated locally.
+        compression = self._get_compression()
+        try:
+            with open(db_file, "wb") as f:
+                if compression:
+                    compress_args, decompress_args = compression
+                    decompressor = subprocess.Popen(
+                        decompress_args,
+                        stdin=subprocess.PIPE,
+                        stdout=f,
+                        stderr=subprocess.PIPE
+                    )
+                    success, output = ssh_manager.stream_remote_command(
+                        self.get_remote_export_command(source_path, compress_args),
+                        stdout=decompressor.stdin
+                    )
+                    decompressor.stdin.close()
+                    if decompressor.wait() != 0 and success:
+                        success = False
+                        output = decompressor.stderr.read().decode(errors="replace")
+                    decompressor.stderr.close()
+                else:
+                    success, output = ssh_manager.stream_remote_command(
+                        self.get_remote_export_command(source_path),
+                        stdout=f
+                    )
+        except OSError as e:
+            return False, str(e)
             
-            if not success:
-                print("Failed to transfer database file from remote server")
+        return success, output
+
+    def _get_db_credentials(self, path):
+        """
+        Read the database credentials of a local WordPress site from wp-config.php.
+
+        Args:
+            path (str): Path to the WordPress installation.
+
+        Returns:
+            dict: DB_NAME, DB_USER, DB_PASSWORD and DB_HOST values, or None on failure.
+        """
+        keys = ["DB_NAME", "DB_USER", "DB_PASSWORD", "DB_HOST"]
+        try:
+            result = subprocess.run(
+                [WP_BIN, f"--path={path}", "config", "list", *keys,
+                 "--fields=name,value", "--format=json", "--allow-root"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False
+            )
+            if result.returncode != 0:
+                logger.error(f"Failed to read database credentials: {result.stderr}")
                 return None
                 
-            db_file = local_db_file
+            credentials = {item["name"]: item["value"] for item in json.loads(result.stdout)}
+            
+        except Exception as e:
+            logger.error(f"Error reading database credentials: {e}")
+            return None
+            
+        missing = [key for key in keys if key not in credentials]
+        if missing:
+            logger.info(f"Database credentials missing from wp-config.php: {', '.join(missing)}")
+            return None
+            
+        return credentials
 
-        return db_file
+    def _export_with_mydumper(self, path, db_file):
+        """
+        Export a local database with mydumper into a single SQL file.
+
+        mydumper dumps tables in parallel into one file per table; the table
+        schemas are concatenated first, then the data, then views and triggers,
+        so the result imports like a regular 'wp db export' dump.
+
+        Args:
+            path (str): Path to the WordPress installation.
+            db_file (str): Path of the SQL file to write.
+
+        Returns:
+            bool: True if the export is successful, False otherwise.
+        """
+        credentials = self._get_db_credentials(path)
+        if not credentials:
+            return False
+            
+        # DB_HOST may carry a port or a socket path after the colon
+        host, _, extra = (credentials["DB_HOST"] or "localhost").partition(":")
+        client_options = {
+            "user": credentials["DB_USER"],
+            "password": credentials["DB_PASSWORD"],
+            "host": host,
+        }
+        if extra.isdigit():
+            client_options["port"] = extra
+        elif extra:
+            client_options["socket"] = extra
+            
+        logger.info("Exporting database with mydumper...")
+        dump_dir = tempfile.mkdtemp(prefix="mydumper-", dir=self._local_db_temp)
+        # Pass credentials through an option file so the password stays off the command line
+        fd, defaults_file = tempfile.mkstemp(suffix=".cnf", dir=self._local_db_temp)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write("[client]\n")
+                for key, value in client_options.items():
+                    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+                    f.write(f'{key}="{escaped}"\n')
+                    
+            cmd = [
+                "mydumper",
+                f"--defaults-file={defaults_file}",
+                "--database", credentials["DB_NAME"],
+                "--outputdir", dump_dir,
+                "--threads", str(os.cpu_count() or 4),
+                "--trx-consistency-only",
+            ]
+            returncode = self._run_local(cmd)
+            if returncode != 0:
+                logger.error(f"mydumper failed (exit code {returncode})")
+                return False
+                
+            files = sorted(name for name in os.listdir(dump_dir) if name.endswith(".sql"))
+            schema_files = [name for name in files if name.endswith("-schema.sql")]
+            data_files = [name for name in files if "-schema" not in name]
+            post_files = [name for name in files
+                          if name.endswith(("-schema-view.sql", "-schema-triggers.sql", "-schema-post.sql"))]
+            
+            with open(db_file, "wb") as out:
+                for name in schema_files + data_files + post_files:
+                    with open(os.path.join(dump_dir, name), "rb") as f:
+                        shutil.copyfileobj(f, out)
+                    out.write(b"\n")
+                    
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error exporting database with mydumper: {e}")
+            return False
+        finally:
+            os.remove(defaults_file)
+            shutil.rmtree(dump_dir, ignore_errors=True)
 
     def import_database(self, direction, db_file, dry_run=False):
         """
@@ -498,78 +829,123 @@ class DatabaseManager:
         if direction == "push":
             # Import to remote
             target_path = self.live_path
-            # Get the correct remote temp directory path
-            remote_db_temp = self._get_remote_db_temp_path()
-            remote_db_file = os.path.join(remote_db_temp, self.db_filename)
             is_remote = True
-            
-            # Transfer database file to remote server
-            if not dry_run:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                
-                # Ensure remote db_temp directory exists
-                mkdir_cmd = f"mkdir -p {remote_db_temp}"
-                ssh_manager.execute_remote_command(mkdir_cmd)
-                
-                # Transfer file
-                success = ssh_manager.transfer_file(db_file, remote_db_file, "push")
-                if not success:
-                    print("Failed to transfer database file to remote server")
-                    return False
-                    
-                db_file = remote_db_file
         else:  # pull
             # Import to local
             target_path = self.local_path
             is_remote = False
 
         if dry_run:
-            print(f"[DRY RUN] Would import database to {target_path} from {db_file}")
+            logger.info(f"[DRY RUN] Would import database to {target_path} from {db_file}")
             return True
 
         # Reset database before import (optional)
         reset_success = self.reset_database(direction, dry_run)
         if not reset_success:
-            print("Warning: Database reset failed, proceeding with import anyway")
+            logger.warning("Warning: Database reset failed, proceeding with import anyway")
 
         # Import database
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            ssh_manager = self._ssh()
             
-            import_cmd = f'wp --path="{target_path}" db import {db_file} --allow-root'
-            success, output = ssh_manager.execute_remote_command(import_cmd)
+            # 'db import -' reads the SQL from stdin, so the local dump is piped
+            # over the SSH channel without a remote temp file or a separate scp pass.
+            # It is compressed locally and inflated on the remote end.
+            compression = self._get_compression()
+            remote_cmd = self.get_remote_import_command(target_path, compression[1] if compression else None)
+            try:
+                with open(db_file, "rb") as f:
+                    if compression:
+                        compressor = subprocess.Popen(
+                            compression[0],
+                            stdin=f,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE
+                        )
+                        success, output = ssh_manager.stream_remote_command(remote_cmd, stdin=compressor.stdout)
+                        compressor.stdout.close()
+                        if compressor.wait() != 0 and success:
+                            success = False
+                            output = compressor.stderr.read().decode(errors="replace")
+                        compressor.stderr.close()
+                    else:
+                        success, output = ssh_manager.stream_remote_command(remote_cmd, stdin=f)
+            except OSError as e:
+                logger.error(f"Error importing database: {e}")
+                return False
             
             if not success:
-                print(f"Failed to import database to remote server: {output}")
+                logger.error(f"Failed to import database to remote server: {output}")
                 return False
                 
-            print("Database imported to remote server")
+            logger.info("Database imported to remote server")
         else:
             try:
-                cmd = f'wp --path="{target_path}" db import {db_file} --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to import local database: {result.stderr}")
+                cmd = [WP_BIN, f"--path={target_path}", "db", "import", db_file, "--allow-root"]
+                returncode = self._run_local(cmd)
+                if returncode != 0:
+                    logger.error(f"Failed to import local database (exit code {returncode})")
                     return False
                     
-                print("Database imported to local server")
+                logger.info("Database imported to local server")
                 
             except Exception as e:
-                print(f"Error importing database: {e}")
+                logger.error(f"Error importing database: {e}")
                 return False
 
         return True
 
+    def _should_backup(self, direction):
+        """
+        Decide whether to backup the destination database before reset.
+
+        Prompts the user once (or answers yes in non-interactive mode) and
+        caches the answer for the rest of the run.
+
+        Args:
+            direction (str): Direction of synchronization ('push' or 'pull').
+
+        Returns:
+            bool: True if the database should be backed up, False otherwise.
+        """
+        if self._backup_decision is not None:
+            return self._backup_decision
+            
+        # Check if database backups are enabled
+        backup_enabled = False
+        if "backup" in self.config and "database" in self.config["backup"]:
+            backup_enabled = self.config["backup"]["database"].get("enabled", False)
+            
+        response = "no"
+        if backup_enabled:
+            non_interactive = self.config.get("_non_interactive", False)
+            if non_interactive:
+                logger.info("\nNon-interactive mode: automatically backing up database before reset.")
+                response = "yes"
+            else:
+                response = input("\nWould you like to backup the destination database before reset? (yes/no): ").lower()
+                
+        self._backup_decision = response in ["yes", "y"]
+        return self._backup_decision
+
+    def _backup_before_reset(self, direction):
+        """
+        Backup the destination database ahead of a reset and report the result.
+
+        Args:
+            direction (str): Direction of synchronization ('push' or 'pull').
+
+        Returns:
+            str: Path to the backup file, or None if backup failed.
+        """
+        self._backup_attempted = True
+        backup_file = self.backup_database(direction, dry_run=False)
+        if backup_file:
+            logger.info(f"Database backed up successfully to: {backup_file}")
+        else:
+            logger.warning("Warning: Database backup failed, proceeding with reset anyway")
+        return backup_file
+
     def reset_database(self, direction, dry_run=False):
         """
         Reset the database in the target environment.
@@ -591,63 +967,39 @@ class DatabaseManager:
             is_remote = False
 
         if dry_run:
-            print(f"[DRY RUN] Would reset database at {target_path}")
+            logger.info(f"[DRY RUN] Would reset database at {target_path}")
             return True
             
-        # Check if database backups are enabled
-        backup_enabled = False
-        if "backup" in self.config and "database" in self.config["backup"]:
-            backup_enabled = self.config["backup"]["database"].get("enabled", False)
-            
-        # Offer to backup the database before reset
-        if backup_enabled:
-            non_interactive = self.config.get("_non_interactive", False)
-            if non_interactive:
-                print("\nNon-interactive mode: automatically backing up database before reset.")
-                response = "yes"
-            else:
-                response = input("\nWould you like to backup the destination database before reset? (yes/no): ").lower()
-            if response in ["yes", "y"]:
-                backup_file = self.backup_database(direction, dry_run=False)
-                if backup_file:
-                    print(f"Database backed up successfully to: {backup_file}")
-                else:
-                    print("Warning: Database backup failed, proceeding with reset anyway")
+        # Offer to backup the database before reset, unless it already ran alongside the export
+        if not self._backup_attempted and self._should_backup(direction):
+            self._backup_before_reset(direction)
                     
-        # Reset database
+        # Reset database. 'wp db reset' is already a single DROP DATABASE plus
+        # CREATE DATABASE rather than a DROP TABLE per table, so there is no
+        # cheaper drop/create path to take here.
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            ssh_manager = self._ssh()
             
             reset_cmd = f'wp --path="{target_path}" db reset --yes --allow-root'
             success, output = ssh_manager.execute_remote_command(reset_cmd)
             
             if not success:
-                print(f"Failed to reset remote database: {output}")
+                logger.error(f"Failed to reset remote database: {output}")
                 return False
                 
-            print("Remote database reset")
+            logger.info("Remote database reset")
         else:
             try:
-                cmd = f'wp --path="{target_path}" db reset --yes --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdin=subprocess.DEVNULL,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to reset local database: {result.stderr}")
+                cmd = [WP_BIN, f"--path={target_path}", "db", "reset", "--yes", "--allow-root"]
+                returncode = self._run_local(cmd)
+                if returncode != 0:
+                    logger.error(f"Failed to reset local database (exit code {returncode})")
                     return False
                     
-                print("Local database reset")
+                logger.info("Local database reset")
                 
             except Exception as e:
-                print(f"Error resetting database: {e}")
+                logger.error(f"Error resetting database: {e}")
                 return False
 
         return True
@@ -673,42 +1025,33 @@ class DatabaseManager:
             is_remote = False
 
         if dry_run:
-            print(f"[DRY RUN] Would clear cache at {target_path}")
+            logger.info(f"[DRY RUN] Would clear cache at {target_path}")
             return True
 
         # Clear cache
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            ssh_manager = self._ssh()
             
             cache_cmd = f'wp --path="{target_path}" cache flush --allow-root'
             success, output = ssh_manager.execute_remote_command(cache_cmd)
             
             if not success:
-                print(f"Failed to clear remote cache: {output}")
+                logger.error(f"Failed to clear remote cache: {output}")
                 return False
                 
-            print("Remote cache cleared")
+            logger.info("Remote cache cleared")
         else:
             try:
-                cmd = f'wp --path="{target_path}" cache flush --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to clear local cache: {result.stderr}")
+                cmd = [WP_BIN, f"--path={target_path}", "cache", "flush", "--allow-root"]
+                returncode = self._run_local(cmd)
+                if returncode != 0:
+                    logger.error(f"Failed to clear local cache (exit code {returncode})")
                     return False
                     
-                print("Local cache cleared")
+                logger.info("Local cache cleared")
                 
             except Exception as e:
-                print(f"Error clearing cache: {e}")
+                logger.error(f"Error clearing cache: {e}")
                 return False
 
         return True
@@ -717,6 +1060,9 @@ class DatabaseManager:
         """
         Clean up temporary files after synchronization.
 
+        Dumps are streamed over SSH, so nothing is written to the remote temp
+        directory; only the local database file and temp directory are removed.
+
         Args:
             direction (str): Direction of synchronization ('push' or 'pull').
             db_file (str): Path to the database file to clean up.
@@ -726,70 +1072,31 @@ class DatabaseManager:
             bool: True if cleanup is successful, False otherwise.
         """
         if dry_run:
-            print(f"[DRY RUN] Would clean up temporary files")
+            logger.info(f"[DRY RUN] Would clean up temporary files")
             return True
 
         try:
-            # Get the correct local and remote temp directory paths
+            # Get the correct local temp directory path
             local_db_temp = self._get_local_db_temp_path()
-            remote_db_temp = self._get_remote_db_temp_path()
-            remote_db_file = os.path.join(remote_db_temp, self.db_filename)
             
             # Clean up local database file and directory
             if os.path.exists(db_file):
                 os.remove(db_file)
-                print(f"Removed local database file: {db_file}")
+                logger.info(f"Removed local database file: {db_file}")
             
             # Remove the local temp directory if it exists and is empty
             if os.path.exists(local_db_temp):
-                # Check if directory is empty
-                if not os.listdir(local_db_temp):
+                # Check if directory is empty, stopping at the first entry
+                with os.scandir(local_db_temp) as entries:
+                    is_empty = next(entries, None) is None
+                if is_empty:
                     os.rmdir(local_db_temp)
-                    print(f"Removed local temp directory: {local_db_temp}")
-                else:
-                    print(f"Local temp directory not empty, skipping removal: {local_db_temp}")
-
-            # Clean up remote database file and directory
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
-            
-            if direction == "push":
-                # Clean up the file we pushed to the remote server
-                cleanup_cmd = f'rm -f "{remote_db_file}"'
-                success, _ = ssh_manager.execute_remote_command(cleanup_cmd)
-                
-                if success:
-                    print(f"Removed remote database file: {remote_db_file}")
-                else:
-                    print(f"Warning: Failed to remove remote database file: {remote_db_file}")
-                
-                # Force remove the remote temp directory
-                rmdir_cmd = f'rm -rf "{remote_db_temp}"'
-                success, _ = ssh_manager.execute_remote_command(rmdir_cmd)
-                if success:
-                    print(f"Removed remote temp directory: {remote_db_temp}")
-                else:
-                    print(f"Warning: Failed to remove remote temp directory: {remote_db_temp}")
-            else:  # pull
-                # Clean up the file we exported on the remote server
-                cleanup_cmd = f'rm -f "{remote_db_file}"'
-                success, _ = ssh_manager.execute_remote_command(cleanup_cmd)
-                
-                if success:
-                    print(f"Removed remote database file: {remote_db_file}")
-                else:
-                    print(f"Warning: Failed to remove remote database file: {remote_db_file}")
-                
-                # Force remove the remote temp directory
-                rmdir_cmd = f'rm -rf "{remote_db_temp}"'
-                success, _ = ssh_manager.execute_remote_command(rmdir_cmd)
-                if success:
-                    print(f"Removed remote temp directory: {remote_db_temp}")
+                    logger.info(f"Removed local temp directory: {local_db_temp}")
                 else:
-                    print(f"Warning: Failed to remove remote temp directory: {remote_db_temp}")
+                    logger.info(f"Local temp directory not empty, skipping removal: {local_db_temp}")
 
             return True
             
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.error(f"Error during cleanup: {e}")
             return False
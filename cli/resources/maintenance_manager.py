@@ -6,10 +6,17 @@ This module manages the activation and deactivation of maintenance mode
 during WordPress synchronization to prevent user access during the process.
 """
 
+import logging
 import os
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from resources.ssh_manager import SSHManager
+from resources.wp_cli import WP_BIN
+
+logger = logging.getLogger(__name__)
 
 
 class MaintenanceManager:
@@ -25,37 +32,64 @@ class MaintenanceManager:
         self.config = config
         self.local_path = config["paths"]["local"]
         self.live_path = config["paths"]["live"]
+        
+        # WP-CLI command prefixes for each environment, built once
+        self._local_wp = [WP_BIN, f"--path={self.local_path}", "--allow-root"]
+        self._remote_wp = f"wp {shlex.quote(f'--path={self.live_path}')} --allow-root"
+        
+        # Shared SSH manager, created on first remote call
+        self._ssh_manager = None
 
-    def activate_maintenance_mode(self, direction, dry_run=False):
+    def _ssh(self):
         """
-        Activate maintenance mode on both local and remote environments.
+        Get the SSH manager shared by all remote maintenance operations.
+
+        Returns:
+            SSHManager: SSH manager instance.
+        """
+        if self._ssh_manager is None:
+            self._ssh_manager = SSHManager(self.config)
+        return self._ssh_manager
+
+    def get_maintenance_environments(self, direction):
+        """
+        Work out which environments need maintenance mode for a sync.
+
+        Only the target of the sync is changed by it, so by default only the target
+        is put into maintenance mode. Setting maintenance.include_source also covers
+        the source, which keeps it from changing while it is being copied.
 
         Args:
             direction (str): Direction of synchronization ('push' or 'pull').
-            dry_run (bool): If True, only print the command without executing.
 
         Returns:
-            bool: True if activation is successful, False otherwise.
+            tuple: (local, remote) booleans, True for each environment to cover.
         """
-        if dry_run:
-            print("[DRY RUN] Would activate maintenance mode on local and remote environments")
-            return True
+        include_source = self.config.get("maintenance", {}).get("include_source", False)
+        return direction == "pull" or include_source, direction == "push" or include_source
 
-        # Activate maintenance mode on local environment
-        local_success = self._activate_local_maintenance_mode()
-        if not local_success:
-            print("Warning: Failed to activate maintenance mode on local environment")
+    def activate_maintenance_mode(self, direction, dry_run=False):
+        """
+        Activate maintenance mode on the environments affected by the sync.
 
-        # Activate maintenance mode on remote environment
-        remote_success = self._activate_remote_maintenance_mode()
-        if not remote_success:
-            print("Warning: Failed to activate maintenance mode on remote environment")
+        Args:
+            direction (str): Direction of synchronization ('push' or 'pull').
+            dry_run (bool): If True, only print the command without executing.
 
-        return local_success and remote_success
+        Returns:
+            bool: True if activation is successful, False otherwise.
+        """
+        return self._toggle_maintenance_mode(
+            direction,
+            "activate",
+            self._activate_local_maintenance_mode,
+            self._activate_remote_maintenance_mode,
+            dry_run
+        )
 
     def deactivate_maintenance_mode(self, direction, dry_run=False):
         """
-        Deactivate maintenance mode on both local and remote environments.
+        Deactivate maintenance mode on the environments affected by the sync.
 
         Args:
             direction (str): Direction of synchronization ('push' or 'pull').
@@ -64,21 +98,52 @@ class MaintenanceManager:
         Returns:
             bool: True if deactivation is successful, False otherwise.
         """
+        return self._toggle_maintenance_mode(
+            direction,
+            "deactivate",
+            self._deactivate_local_maintenance_mode,
+            self._deactivate_remote_maintenance_mode,
+            dry_run
+        )
+
+    def _toggle_maintenance_mode(self, direction, action, local_func, remote_func, dry_run=False):
+        """
+        Run a maintenance mode toggle on each environment covered for this direction.
+
+        Args:
+            direction (str): Direction of synchronization ('push' or 'pull').
+            action (str): 'activate' or 'deactivate', used in messages.
+            local_func (callable): Toggle for the local environment.
+            remote_func (callable): Toggle for the remote environment.
+            dry_run (bool): If True, only print the command without executing.
+
+        Returns:
+            bool: True if every toggle succeeded, False otherwise.
+        """
+        local, remote = self.get_maintenance_environments(direction)
+        tasks = []
+        if local:
+            tasks.append(("local", local_func))
+        if remote:
+            tasks.append(("remote", remote_func))
+
         if dry_run:
-            print("[DRY RUN] Would deactivate maintenance mode on local and remote environments")
+            environments = " and ".join(env for env, _ in tasks)
+            logger.info(f"[DRY RUN] Would {action} maintenance mode on {environments} environment{'s' if len(tasks) > 1 else ''}")
             return True
 
-        # Deactivate maintenance mode on local environment
-        local_success = self._deactivate_local_maintenance_mode()
-        if not local_success:
-            print("Warning: Failed to deactivate maintenance mode on local environment")
+        # Both environments are independent, so toggle them at once when both are covered
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [(env, executor.submit(func)) for env, func in tasks]
+            results = [(env, future.result()) for env, future in futures]
 
-        # Deactivate maintenance mode on remote environment
-        remote_success = self._deactivate_remote_maintenance_mode()
-        if not remote_success:
-            print("Warning: Failed to deactivate maintenance mode on remote environment")
+        all_success = True
+        for env, success in results:
+            if not success:
+                logger.warning(f"Warning: Failed to {action} maintenance mode on {env} environment")
+                all_success = False
 
-        return local_success and remote_success
+        return all_success
 
     def _activate_local_maintenance_mode(self):
         """
@@ -88,26 +153,25 @@ class MaintenanceManager:
             bool: True if activation is successful, False otherwise.
         """
         try:
-            print("Activating maintenance mode on local environment...")
-            cmd = f'wp --path="{self.local_path}" maintenance-mode activate --allow-root'
+            logger.info("Activating maintenance mode on local environment...")
+            cmd = [*self._local_wp, "maintenance-mode", "activate"]
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                check=False,
-                shell=True
+                check=False
             )
             
             if result.returncode != 0:
-                print(f"Failed to activate maintenance mode on local environment: {result.stderr}")
+                logger.error(f"Failed to activate maintenance mode on local environment: {result.stderr}")
                 return False
                 
-            print("Maintenance mode activated on local environment")
+            logger.info("Maintenance mode activated on local environment")
             return True
             
         except Exception as e:
-            print(f"Error activating maintenance mode on local environment: {e}")
+            logger.error(f"Error activating maintenance mode on local environment: {e}")
             return False
 
     def _deactivate_local_maintenance_mode(self):
@@ -118,26 +182,25 @@ class MaintenanceManager:
             bool: True if deactivation is successful, False otherwise.
         """
         try:
-            print("Deactivating maintenance mode on local environment...")
-            cmd = f'wp --path="{self.local_path}" maintenance-mode deactivate --allow-root'
+            logger.info("Deactivating maintenance mode on local environment...")
+            cmd = [*self._local_wp, "maintenance-mode", "deactivate"]
             result = subprocess.run(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                check=False,
-                shell=True
+                check=False
             )
             
             if result.returncode != 0:
-                print(f"Failed to deactivate maintenance mode on local environment: {result.stderr}")
+                logger.error(f"Failed to deactivate maintenance mode on local environment: {result.stderr}")
                 return False
                 
-            print("Maintenance mode deactivated on local environment")
+            logger.info("Maintenance mode deactivated on local environment")
             return True
             
         except Exception as e:
-            print(f"Error deactivating maintenance mode on local environment: {e}")
+            logger.error(f"Error deactivating maintenance mode on local environment: {e}")
             return False
 
     def _activate_remote_maintenance_mode(self):
@@ -148,22 +211,21 @@ class MaintenanceManager:
             bool: True if activation is successful, False otherwise.
         """
         try:
-            print("Activating maintenance mode on remote environment...")
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            logger.info("Activating maintenance mode on remote environment...")
+            ssh_manager = self._ssh()
             
-            cmd = f'wp --path="{self.live_path}" maintenance-mode activate --allow-root'
+            cmd = f"{self._remote_wp} maintenance-mode activate"
             success, output = ssh_manager.execute_remote_command(cmd)
             
             if not success:
-                print(f"Failed to activate maintenance mode on remote environment: {output}")
+                logger.error(f"Failed to activate maintenance mode on remote environment: {output}")
                 return False
                 
-            print("Maintenance mode activated on remote environment")
+            logger.info("Maintenance mode activated on remote environment")
             return True
             
         except Exception as e:
-            print(f"Error activating maintenance mode on remote environment: {e}")
+            logger.error(f"Error activating maintenance mode on remote environment: {e}")
             return False
 
     def _deactivate_remote_maintenance_mode(self):
@@ -174,22 +236,21 @@ class MaintenanceManager:
             bool: True if deactivation is successful, False otherwise.
         """
         try:
-            print("Deactivating maintenance mode on remote environment...")
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            logger.info("Deactivating maintenance mode on remote environment...")
+            ssh_manager = self._ssh()
             
-            cmd = f'wp --path="{self.live_path}" maintenance-mode deactivate --allow-root'
+            cmd = f"{self._remote_wp} maintenance-mode deactivate"
             success, output = ssh_manager.execute_remote_command(cmd)
             
             if not success:
-                print(f"Failed to deactivate maintenance mode on remote environment: {output}")
+                logger.error(f"Failed to deactivate maintenance mode on remote environment: {output}")
                 return False
                 
-            print("Maintenance mode deactivated on remote environment")
+            logger.info("Maintenance mode deactivated on remote environment")
             return True
             
         except Exception as e:
-            print(f"Error deactivating maintenance mode on remote environment: {e}")
+            logger.error(f"Error deactivating maintenance mode on remote environment: {e}")
             return False
 
     def check_maintenance_mode_status(self, is_remote=False):
@@ -202,38 +263,26 @@ class MaintenanceManager:
         Returns:
             bool: True if maintenance mode is active, False otherwise.
         """
+        # Maintenance mode is just the presence of .maintenance in the site root, so
+        # test for the file instead of bootstrapping WordPress to parse its status text
         try:
             if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
+                ssh_manager = self._ssh()
                 
-                cmd = f'wp --path="{self.live_path}" maintenance-mode status --allow-root'
-                success, output = ssh_manager.execute_remote_command(cmd)
+                remote_file = os.path.join(self.live_path, ".maintenance")
+                # Echo the test status so "not active" isn't reported as a failed SSH command
+                success, output = ssh_manager.execute_remote_command(f"test -f {shlex.quote(remote_file)}; echo $?")
                 
                 if not success:
-                    print(f"Failed to check maintenance mode status on remote environment: {output}")
+                    logger.error(f"Failed to check maintenance mode status on remote environment: {output}")
                     return False
                     
-                return "is active" in output.lower()
+                return output.strip() == "0"
             else:
-                cmd = f'wp --path="{self.local_path}" maintenance-mode status --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to check maintenance mode status on local environment: {result.stderr}")
-                    return False
-                    
-                return "is active" in result.stdout.lower()
+                return os.path.isfile(os.path.join(self.local_path, ".maintenance"))
                 
         except Exception as e:
-            print(f"Error checking maintenance mode status: {e}")
+            logger.error(f"Error checking maintenance mode status: {e}")
             return False
 
     def create_maintenance_file(self, is_remote=False, dry_run=False):
@@ -248,46 +297,38 @@ class MaintenanceManager:
             bool: True if file creation is successful, False otherwise.
         """
         if dry_run:
-            print(f"[DRY RUN] Would create .maintenance file on {'remote' if is_remote else 'local'} environment")
+            logger.info(f"[DRY RUN] Would create .maintenance file on {'remote' if is_remote else 'local'} environment")
             return True
 
         maintenance_content = "<?php $upgrading = time(); ?>"
         
         try:
             if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                
-                # Create temporary file locally
-                raw_db_temp = self.config["paths"]["db_temp"]
-                local_db_temp = raw_db_temp.get("local", "/tmp") if isinstance(raw_db_temp, dict) else raw_db_temp
-                temp_file = os.path.join(local_db_temp, ".maintenance")
-                with open(temp_file, "w") as f:
-                    f.write(maintenance_content)
+                ssh_manager = self._ssh()
                 
-                # Transfer to remote
+                # Write the file straight from stdin; no local temp file or transfer needed
                 remote_file = os.path.join(self.live_path, ".maintenance")
-                success = ssh_manager.transfer_file(temp_file, remote_file, "push")
-                
-                # Clean up temporary file
-                os.remove(temp_file)
+                success, _ = ssh_manager.execute_remote_command(
+                    f"cat > {shlex.quote(remote_file)}",
+                    stdin_data=maintenance_content
+                )
                 
                 if not success:
-                    print("Failed to create .maintenance file on remote environment")
+                    logger.error("Failed to create .maintenance file on remote environment")
                     return False
                     
-                print(".maintenance file created on remote environment")
+                logger.info(".maintenance file created on remote environment")
                 return True
             else:
                 maintenance_file = os.path.join(self.local_path, ".maintenance")
                 with open(maintenance_file, "w") as f:
                     f.write(maintenance_content)
                     
-                print(".maintenance file created on local environment")
+                logger.info(".maintenance file created on local environment")
                 return True
                 
         except Exception as e:
-            print(f"Error creating .maintenance file: {e}")
+            logger.error(f"Error creating .maintenance file: {e}")
             return False
 
     def remove_maintenance_file(self, is_remote=False, dry_run=False):
@@ -302,32 +343,33 @@ class MaintenanceManager:
             bool: True if file removal is successful, False otherwise.
         """
         if dry_run:
-            print(f"[DRY RUN] Would remove .maintenance file from {'remote' if is_remote else 'local'} environment")
+            logger.info(f"[DRY RUN] Would remove .maintenance file from {'remote' if is_remote else 'local'} environment")
             return True
 
         try:
             if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
+                ssh_manager = self._ssh()
                 
                 remote_file = os.path.join(self.live_path, ".maintenance")
-                cmd = f'rm -f "{remote_file}"'
+                cmd = f"rm -f {shlex.quote(remote_file)}"
                 success, _ = ssh_manager.execute_remote_command(cmd)
                 
                 if not success:
-                    print("Failed to remove .maintenance file from remote environment")
+                    logger.error("Failed to remove .maintenance file from remote environment")
                     return False
                     
-                print(".maintenance file removed from remote environment")
+                logger.info(".maintenance file removed from remote environment")
                 return True
             else:
                 maintenance_file = os.path.join(self.local_path, ".maintenance")
-                if os.path.exists(maintenance_file):
+                try:
                     os.remove(maintenance_file)
+                except FileNotFoundError:
+                    pass
                     
-                print(".maintenance file removed from local environment")
+                logger.info(".maintenance file removed from local environment")
                 return True
                 
         except Exception as e:
-            print(f"Error removing .maintenance file: {e}")
+            logger.error(f"Error removing .maintenance file: {e}")
             return False
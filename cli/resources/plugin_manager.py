@@ -7,9 +7,16 @@ It ensures that specific plugins are activated or deactivated on the target envi
 based on the configuration.
 """
 
+import json
+import logging
 import os
+import shlex
 import subprocess
 import sys
+from resources.ssh_manager import SSHManager
+from resources.wp_cli import WP_BIN
+
+logger = logging.getLogger(__name__)
 
 
 class PluginManager:
@@ -29,6 +36,24 @@ class PluginManager:
         # Check if plugins configuration exists
         self.plugins_config = config.get("plugins", {})
         self.has_plugin_config = bool(self.plugins_config)
+        
+        # WP-CLI command prefixes for each environment, built once
+        self._local_wp = [WP_BIN, f"--path={self.local_path}", "--allow-root"]
+        self._remote_wp = f"wp {shlex.quote(f'--path={self.live_path}')} --allow-root"
+        
+        # Shared SSH manager, created on first remote call
+        self._ssh_manager = None
+
+    def _ssh(self):
+        """
+        Get the SSH manager shared by all remote plugin operations.
+
+        Returns:
+            SSHManager: SSH manager instance.
+        """
+        if self._ssh_manager is None:
+            self._ssh_manager = SSHManager(self.config)
+        return self._ssh_manager
 
     def manage_plugins(self, direction, dry_run=False):
         """
@@ -42,17 +67,15 @@ class PluginManager:
             bool: True if plugin management is successful, False otherwise.
         """
         if not self.has_plugin_config:
-            print("No plugin configuration found. Skipping plugin management.")
+            logger.info("No plugin configuration found. Skipping plugin management.")
             return True
 
         if direction == "push":
             # When pushing, manage plugins on the live environment
-            target_path = self.live_path
             target_env = "live"
             is_remote = True
         else:  # pull
             # When pulling, manage plugins on the local environment
-            target_path = self.local_path
             target_env = "local"
             is_remote = False
 
@@ -61,70 +84,152 @@ class PluginManager:
         plugins_to_deactivate = self.plugins_config.get(target_env, {}).get("deactivate", [])
 
         if not plugins_to_activate and not plugins_to_deactivate:
-            print(f"No plugins configured for {target_env} environment. Skipping plugin management.")
+            logger.info(f"No plugins configured for {target_env} environment. Skipping plugin management.")
             return True
 
         if dry_run:
-            print(f"[DRY RUN] Would manage plugins on {target_env} environment:")
+            logger.info(f"[DRY RUN] Would manage plugins on {target_env} environment:")
             if plugins_to_activate:
-                print(f"  - Would activate: {', '.join(plugins_to_activate)}")
+                logger.info(f"  - Would activate: {', '.join(plugins_to_activate)}")
             if plugins_to_deactivate:
-                print(f"  - Would deactivate: {', '.join(plugins_to_deactivate)}")
+                logger.info(f"  - Would deactivate: {', '.join(plugins_to_deactivate)}")
             return True
 
-        # Activate plugins
-        if plugins_to_activate:
-            print(f"Activating plugins on {target_env} environment: {', '.join(plugins_to_activate)}")
-            success = self._activate_plugins(target_path, plugins_to_activate, is_remote)
-            if not success:
-                print(f"Warning: Failed to activate some plugins on {target_env} environment")
+        # Only touch plugins whose state actually needs to change
+        active_plugins = self._get_active_plugins(is_remote)
+        if active_plugins is not None:
+            plugins_to_activate = [p for p in plugins_to_activate if p not in active_plugins]
+            plugins_to_deactivate = [p for p in plugins_to_deactivate if p in active_plugins]
+            if not plugins_to_activate and not plugins_to_deactivate:
+                logger.info(f"Plugins on {target_env} environment are already in the configured state")
+                return True
 
-        # Deactivate plugins
+        if plugins_to_activate:
+            logger.info(f"Activating plugins on {target_env} environment: {', '.join(plugins_to_activate)}")
         if plugins_to_deactivate:
-            print(f"Deactivating plugins on {target_env} environment: {', '.join(plugins_to_deactivate)}")
-            success = self._deactivate_plugins(target_path, plugins_to_deactivate, is_remote)
-            if not success:
-                print(f"Warning: Failed to deactivate some plugins on {target_env} environment")
+            logger.info(f"Deactivating plugins on {target_env} environment: {', '.join(plugins_to_deactivate)}")
+            
+        # Apply both lists in one dispatch
+        success = self._apply_plugin_state(plugins_to_activate, plugins_to_deactivate, is_remote)
+        if not success:
+            logger.warning(f"Warning: Failed to update some plugins on {target_env} environment")
+
+        return True
+
+    def _get_active_plugins(self, is_remote=False):
+        """
+        Get the slugs of the currently active plugins.
+
+        Args:
+            is_remote (bool): Whether to target the remote server.
+
+        Returns:
+            set: Active plugin slugs, or None if they could not be listed.
+        """
+        try:
+            if is_remote:
+                ssh_manager = self._ssh()
+                
+                cmd = f"{self._remote_wp} plugin list --status=active --field=name --format=json"
+                success, output = ssh_manager.execute_remote_command(cmd)
+                if not success:
+                    return None
+            else:
+                cmd = [*self._local_wp, "plugin", "list", "--status=active", "--field=name", "--format=json"]
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    check=False
+                )
+                if result.returncode != 0:
+                    return None
+                output = result.stdout
+                
+            return set(json.loads(output))
+            
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Warning: Could not parse active plugin list: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error listing active plugins: {e}")
+            return None
+
+    def _apply_plugin_state(self, to_activate, to_deactivate, is_remote=False):
+        """
+        Activate and deactivate WordPress plugins in a single dispatch.
+
+        On the remote server both WP-CLI commands run in one SSH call. Each
+        runs even if the other fails, and the call fails if either did. Locally
+        they run one after the other, since both rewrite the active_plugins option.
+
+        Args:
+            to_activate (list): Plugin slugs to activate.
+            to_deactivate (list): Plugin slugs to deactivate.
+            is_remote (bool): Whether to target the remote server.
 
+        Returns:
+            bool: True if every plugin change is successful, False otherwise.
+        """
+        if not is_remote:
+            activated = self._activate_plugins(to_activate)
+            deactivated = self._deactivate_plugins(to_deactivate)
+            return activated and deactivated
+            
+        commands = []
+        for action, plugins in (("activate", to_activate), ("deactivate", to_deactivate)):
+            if plugins:
+                commands.append(f'{self._remote_wp} plugin {action} {" ".join(plugins)} || rc=1')
+        if not commands:
+            return True
+            
+        ssh_manager = self._ssh()
+        
+        cmd = "rc=0; " + "; ".join(commands) + "; exit $rc"
+        success, output = ssh_manager.execute_remote_command(cmd)
+        
+        if not success:
+            logger.error(f"Failed to update plugins on remote server: {output}")
+            return False
+            
+        logger.info("Successfully updated plugins on remote server")
         return True
 
-    def _activate_plugins(self, path, plugins, is_remote=False):
+    def _activate_plugins(self, plugins, is_remote=False):
         """
         Activate WordPress plugins.
 
         Args:
-            path (str): Path to WordPress installation.
             plugins (list): List of plugin slugs to activate.
-            is_remote (bool): Whether the path is on a remote server.
+            is_remote (bool): Whether to target the remote server.
 
         Returns:
             bool: True if activation is successful, False otherwise.
         """
-        return self._manage_plugin_state(path, plugins, "activate", is_remote)
+        return self._manage_plugin_state(plugins, "activate", is_remote)
 
-    def _deactivate_plugins(self, path, plugins, is_remote=False):
+    def _deactivate_plugins(self, plugins, is_remote=False):
         """
         Deactivate WordPress plugins.
 
         Args:
-            path (str): Path to WordPress installation.
             plugins (list): List of plugin slugs to deactivate.
-            is_remote (bool): Whether the path is on a remote server.
+            is_remote (bool): Whether to target the remote server.
 
         Returns:
             bool: True if deactivation is successful, False otherwise.
         """
-        return self._manage_plugin_state(path, plugins, "deactivate", is_remote)
+        return self._manage_plugin_state(plugins, "deactivate", is_remote)
 
-    def _manage_plugin_state(self, path, plugins, action, is_remote=False):
+    def _manage_plugin_state(self, plugins, action, is_remote=False):
         """
         Manage WordPress plugin state (activate or deactivate).
 
         Args:
-            path (str): Path to WordPress installation.
             plugins (list): List of plugin slugs to manage.
             action (str): Action to perform ('activate' or 'deactivate').
-            is_remote (bool): Whether the path is on a remote server.
+            is_remote (bool): Whether to target the remote server.
 
         Returns:
             bool: True if the operation is successful, False otherwise.
@@ -132,42 +237,39 @@ class PluginManager:
         if not plugins:
             return True
 
-        # Join plugin slugs with spaces for the WP-CLI command
-        plugin_list = " ".join(plugins)
-        
-        # Build the WP-CLI command
-        cmd = f'wp --path="{path}" plugin {action} {plugin_list} --allow-root'
-        
         if is_remote:
-            from resources.ssh_manager import SSHManager
-            ssh_manager = SSHManager(self.config)
+            # Join plugin slugs with spaces for the WP-CLI command
+            plugin_list = " ".join(plugins)
+            cmd = f"{self._remote_wp} plugin {action} {plugin_list}"
+            
+            ssh_manager = self._ssh()
             
             success, output = ssh_manager.execute_remote_command(cmd)
             
             if not success:
-                print(f"Failed to {action} plugins on remote server: {output}")
+                logger.error(f"Failed to {action} plugins on remote server: {output}")
                 return False
                 
-            print(f"Successfully {action}d plugins on remote server")
+            logger.info(f"Successfully {action}d plugins on remote server")
         else:
             try:
+                cmd = [*self._local_wp, "plugin", action, *plugins]
                 result = subprocess.run(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
-                    print(f"Failed to {action} plugins: {result.stderr}")
+                    logger.error(f"Failed to {action} plugins: {result.stderr}")
                     return False
                     
-                print(f"Successfully {action}d plugins")
+                logger.info(f"Successfully {action}d plugins")
                 
             except Exception as e:
-                print(f"Error {action}ing plugins: {e}")
+                logger.error(f"Error {action}ing plugins: {e}")
                 return False
 
         return True
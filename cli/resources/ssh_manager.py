@@ -2,18 +2,258 @@
 """
 SSH Manager for WordPress Sync.
 
-This module manages SSH connections and file transfers using rsync and scp.
+This module manages SSH connections and file transfers using rsync.
 It handles establishing SSH connections to the server, executing remote commands,
 and transferring files between local and remote servers.
 """
 
+import fnmatch
+import heapq
+import ipaddress
 import os
+import select
 import subprocess
 import shlex
+import socket
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from resources.password_manager import PasswordManager
 
+# Marks the end of each command's output in execute_remote_commands, followed by its exit status
+_COMMAND_SEPARATOR = "__WPSYNC_SEP__:"
+
+# Below this many files, local cleanup deletes serially rather than with a thread pool
+_PARALLEL_UNLINK_MIN = 128
+
+# Whether each server host resolves to a loopback or private address, so 'auto'
+# whole-file mode costs one DNS lookup per host for the whole process
+_LAN_HOSTS = {}
+
+# In-process SSH clients for the 'paramiko' backend, keyed by (user, host, port, key)
+# so every SSHManager in the process shares one authenticated connection per server.
+_PARAMIKO_CLIENTS = {}
+
+
+def _control_socket_path():
+    """
+    Pick the ControlPath used to multiplex ssh and rsync calls.
+
+    %C is a hash of the connection parameters, so the socket name stays short
+    and unique per local user, remote user, host and port.
+
+    Returns:
+        str: ControlPath pattern, or None if ~/.ssh can't hold the socket.
+    """
+    ssh_dir = os.path.expanduser("~/.ssh")
+    if not (os.path.isdir(ssh_dir) and os.access(ssh_dir, os.W_OK)):
+        return None
+    return os.path.join(ssh_dir, "wpsync-%C")
+
+
+def _auto_cipher():
+    """
+    Pick the ssh cipher that encrypts fastest on this machine's CPU.
+
+    AES-GCM is the quickest cipher on CPUs with AES instructions; without them
+    ChaCha20-Poly1305 is faster. Only Linux exposes the CPU flags cheaply, so
+    elsewhere ssh's own preference is kept.
+
+    Returns:
+        str: Cipher name, or None to leave the choice to ssh.
+    """
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith(("flags", "Features")):
+                    return "aes128-gcm@openssh.com" if "aes" in line.split() else "chacha20-poly1305@openssh.com"
+    except OSError:
+        pass
+    return None
+
+
+def _sudo_from_stdin(command):
+    """
+    Make a command's leading sudo read the password from stdin, without a prompt.
+
+    Only the leading sudo is rewritten, so 'sudo' elsewhere in the command
+    (e.g. in a path) is left alone.
+
+    Args:
+        command (str): Command starting with 'sudo'.
+
+    Returns:
+        str: Command running 'sudo -S -p ""'.
+    """
+    return "sudo -S -p '' " + command.strip()[len("sudo"):].lstrip()
+
+
+def _is_excluded(rel_path, excludes):
+    """
+    Approximate rsync's --exclude matching for a path relative to the transfer root.
+
+    Patterns without a slash match any path component; patterns with one match
+    the end of the path (or the whole path when anchored with a leading slash).
+
+    Args:
+        rel_path (str): Path relative to the transfer root.
+        excludes (list): rsync exclude patterns.
+
+    Returns:
+        bool: True if the path matches an exclude pattern.
+    """
+    parts = rel_path.split("/")
+    for pattern in excludes:
+        pattern = pattern.rstrip("/")
+        if "/" not in pattern:
+            if any(fnmatch.fnmatchcase(part, pattern) for part in parts):
+                return True
+        elif pattern.startswith("/"):
+            if fnmatch.fnmatchcase(rel_path, pattern[1:]):
+                return True
+        elif any(fnmatch.fnmatchcase("/".join(parts[i:]), pattern) for i in range(len(parts))):
+            return True
+    return False
+
+
+def _find_matching_files(root, patterns):
+    """
+    Walk a tree once and yield the regular files whose name matches any pattern.
+
+    Equivalent to 'find root \\( -name p1 -o -name p2 ... \\) -type f'.
+
+    Args:
+        root (str): Directory to search.
+        patterns (list): Shell-style filename patterns.
+
+    Yields:
+        str: Path of each matching file.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in patterns):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _unlink(path):
+    """
+    Delete a file, treating one that is already gone as deleted.
+
+    Args:
+        path (str): File to delete.
+
+    Returns:
+        OSError: The error if the file couldn't be deleted, otherwise None.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        return e
+    return None
+
+
+def _newlines_for_chunk(data, pending_cr):
+    """
+    Turn the carriage returns in a chunk of output into newlines.
+
+    A CRLF may be split across reads, so a leading LF is dropped when the
+    previous chunk already ended with its CR.
+
+    Args:
+        data (bytes): Chunk read from a pipe.
+        pending_cr (bool): Whether the previous chunk ended with a CR.
+
+    Returns:
+        tuple: (converted chunk, whether this chunk ended with a CR)
+    """
+    if pending_cr and data.startswith(b"\n"):
+        data = data[1:]
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n"), data.endswith(b"\r")
+
+
+def _relay_pipe(stream, out_fd, lock, collected=None):
+    """
+    Copy one of a child's pipes to a file descriptor until EOF.
+
+    Args:
+        stream (file): Pipe to read.
+        out_fd (int): File descriptor to write to.
+        lock (threading.Lock): Held while writing, so chunks from other pipes don't interleave.
+        collected (bytearray, optional): Receives everything read from the pipe.
+    """
+    pending_cr = False
+    for data in iter(lambda: os.read(stream.fileno(), 65536), b""):
+        if collected is not None:
+            collected += data
+        data, pending_cr = _newlines_for_chunk(data, pending_cr)
+        with lock:
+            while data:
+                data = data[os.write(out_fd, data):]
+    stream.close()
+
+
+def _relay_output(process):
+    """
+    Copy a child's stdout and stderr to our stdout as they arrive.
+
+    Both pipes are multiplexed with select() on the calling thread, so rsync's
+    frequent progress updates need no reader threads or per-line decoding.
+    select() only accepts sockets on Windows, so there each pipe gets a reader
+    thread instead. Carriage returns become newlines, so every progress update
+    still arrives as its own line.
+
+    Args:
+        process (subprocess.Popen): Process started with stdout and stderr pipes.
+
+    Returns:
+        str: Everything the process wrote to stderr.
+    """
+    sys.stdout.flush()
+    out_fd = sys.stdout.fileno()
+    stderr_output = bytearray()
+    
+    if os.name == "nt":
+        lock = threading.Lock()
+        readers = [
+            threading.Thread(target=_relay_pipe, args=(process.stdout, out_fd, lock)),
+            threading.Thread(target=_relay_pipe, args=(process.stderr, out_fd, lock, stderr_output)),
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        return stderr_output.decode(errors="replace")
+    
+    stderr_fd = process.stderr.fileno()
+    streams = {process.stdout.fileno(): process.stdout, process.stderr.fileno(): process.stderr}
+    pending_cr = dict.fromkeys(streams, False)
+    
+    while streams:
+        readable, _, _ = select.select(list(streams), [], [])
+        for fd in readable:
+            data = os.read(fd, 65536)
+            if not data:
+                streams.pop(fd).close()
+                continue
+            if fd == stderr_fd:
+                stderr_output += data
+            data, pending_cr[fd] = _newlines_for_chunk(data, pending_cr[fd])
+            while data:
+                data = data[os.write(out_fd, data):]
+            
+    return stderr_output.decode(errors="replace")
+
 
 class SSHManager:
     """Manages SSH connections and file transfers for WordPress Sync."""
@@ -50,23 +290,172 @@ class SSHManager:
         # so SSH/SCP fail fast instead of hanging waiting for a passphrase.
         self.non_interactive = config.get("_non_interactive", False)
         
-        self.rsync_options = self._build_rsync_options()
+        # 'ssh' runs the ssh binary per command; 'paramiko' runs remote commands (plain,
+        # or sudo with a password) over an in-process connection, falling back to 'ssh'
+        # if it can't be used
+        self.backend = config["ssh"].get("backend", "ssh")
+        
+        # Multiplex every ssh and rsync call over one persistent master connection so
+        # only the first call of a run pays for the TCP and authentication handshake
+        self.control_path = _control_socket_path()
+        
+        # ssh argv prefixes only depend on config, so build them once; in non-interactive
+        # mode (e.g. from a GUI) fail fast instead of prompting for a passphrase
+        batch_args = ("-o", "BatchMode=yes", "-o", "ConnectTimeout=30") if self.non_interactive else ()
+        crypto_args = self._ssh_crypto_args()
+        self._ssh_base = ("ssh", "-i", self.ssh_key_path, "-p", str(self.ssh_port), *crypto_args, *self._ssh_base_args(), *batch_args)
+        self._sudo_ssh_base = ("ssh", "-i", self.sudo_key_path, "-p", str(self.ssh_port), *crypto_args, *self._ssh_base_args(), *batch_args)
+        self._ssh_target = f"{self.ssh_user}@{self.ssh_host}"
+        self._sudo_ssh_target = f"{self.sudo_user}@{self.ssh_host}"
+        # Single-file copies compress on the wire; --inplace implies --partial, so an
+        # interrupted copy picks up where it stopped
+        self._file_transfer_base = ("rsync", "-z", "--inplace", "--partial", "-e", shlex.join(self._ssh_base))
+        
+        # rsync options only depend on config, so they are built once, on first use:
+        # 'auto' whole-file mode resolves the host, which most managers never need
+        self._rsync_options = None
+        # Slash-terminated roots also only depend on config
+        self._local_path_slash = os.path.join(self.local_path, "")
+        self._live_path_slash = os.path.join(self.live_path, "")
         self.password_manager = PasswordManager()
+        
+        # Probe results that hold for the whole run
+        self._connection_ok = False
+        self._nopasswd_cache = {}
+
+    def _ssh_base_args(self):
+        """
+        Build the ssh options that share one master connection across calls.
+
+        Returns:
+            list: ssh options, empty if multiplexing is unavailable.
+        """
+        if not self.control_path:
+            return []
+        return [
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self.control_path}",
+            "-o", "ControlPersist=600",
+        ]
+
+    def _ssh_crypto_args(self):
+        """
+        Build the ssh cipher and MAC options from ssh.cipher and ssh.macs.
+
+        ssh.cipher may name a cipher or be 'auto', which picks the fastest one
+        for this CPU. Both are unset by default, leaving the choice to ssh.
+
+        Returns:
+            tuple: ssh options, empty if nothing is configured.
+        """
+        args = ()
+        cipher = self.config["ssh"].get("cipher")
+        if cipher == "auto":
+            cipher = _auto_cipher()
+        if cipher:
+            args += ("-c", cipher)
+        macs = self.config["ssh"].get("macs")
+        if macs:
+            args += ("-m", macs)
+        return args
+
+    def ssh_argv(self):
+        """
+        Get the ssh command line, up to and including the target, used for remote calls.
+
+        Returns:
+            list: ssh executable, options and user@host; append a remote command to run it.
+        """
+        return [*self._ssh_base, self._ssh_target]
+
+    def close(self):
+        """
+        Shut down the shared SSH master connections and any in-process client.
+
+        Safe to call more than once; a later remote call just opens a new connection.
+        """
+        client = _PARAMIKO_CLIENTS.pop((self.ssh_user, self.ssh_host, self.ssh_port, self.ssh_key_path), None)
+        if client is not None:
+            client.close()
+            
+        if not self.control_path:
+            return
+            
+        for user in {self.ssh_user, self.sudo_user} - {None}:
+            subprocess.run(
+                ["ssh", "-p", str(self.ssh_port), "-o", f"ControlPath={self.control_path}",
+                 "-O", "exit", f"{user}@{self.ssh_host}"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+
+    def _use_whole_file(self):
+        """
+        Decide whether rsync should copy whole files instead of sending deltas.
+
+        rsync.whole_file may be true, false or 'auto' (the default), which
+        enables it when the server is on a loopback or private (LAN) address.
+
+        Returns:
+            bool: True if --whole-file should be used.
+        """
+        whole_file = self.config["rsync"].get("whole_file", "auto")
+        if whole_file != "auto":
+            return bool(whole_file)
+            
+        if self.ssh_host not in _LAN_HOSTS:
+            try:
+                address = ipaddress.ip_address(socket.gethostbyname(self.ssh_host))
+                _LAN_HOSTS[self.ssh_host] = address.is_private or address.is_loopback
+            except (OSError, ValueError):
+                # Unresolvable here (e.g. an ssh_config alias); keep the delta transfer
+                _LAN_HOSTS[self.ssh_host] = False
+        return _LAN_HOSTS[self.ssh_host]
+
+    def get_rsync_options(self):
+        """
+        Get the rsync options for file transfers, building them on first use.
+
+        Returns:
+            tuple: rsync options.
+        """
+        if self._rsync_options is None:
+            self._rsync_options = self._build_rsync_options()
+        return self._rsync_options
 
     def _build_rsync_options(self):
         """
         Build rsync options from configuration.
 
         Returns:
-            list: List of rsync options.
+            tuple: rsync options.
         """
-        options = []
+        # Whole-file copies on fast links, where rsync's delta checksums cost more
+        # CPU than they save in bandwidth; compression is skipped there too. When the
+        # delta is kept, no --block-size is set: rsync already sizes blocks at about
+        # sqrt(file size) for each file, which a single run-wide value can't improve on
+        whole_file = self._use_whole_file()
+        compress = self.config["rsync"].get("compress", True) and not whole_file
 
-        # Basic options
-        options.append("-avz")  # Archive mode, verbose, compress
+        # Progress and per-file listings only help someone watching a terminal; piped
+        # to a log (cron, CI) they are thousands of lines per GB. The GUI reads progress
+        # from its pipe and always asks for itemized changes, so those runs keep them
+        show_output = (
+            sys.stdout.isatty()
+            or self.config.get("_itemize_changes", False)
+            or self.config["rsync"].get("force_progress", False)
+        )
+
+        # Basic options: archive mode, verbose, and compress unless disabled
+        options = [("-av" if show_output else "-a") + ("z" if compress else "")]
+        if not show_output:
+            # A single summary still reports what the transfer did
+            options.append("--stats")
 
         # Progress
-        if self.config["rsync"].get("progress", True):
+        if show_output and self.config["rsync"].get("progress", True):
             options.append("--progress")
             # Add info=progress2 for better progress reporting
             options.append("--info=progress2")
@@ -76,13 +465,12 @@ class SSHManager:
             options.extend(["--delete", "--delete-after"])
 
         # Verbose
-        if self.config["rsync"].get("verbose", True):
+        if show_output and self.config["rsync"].get("verbose", True):
             options.append("--verbose")
 
-        # Compress
-        if not self.config["rsync"].get("compress", True):
-            options.remove("-avz")
-            options.append("-av")
+        # Whole file
+        if whole_file:
+            options.append("--whole-file")
 
         # File permissions
         chmod_files = self.config["rsync"].get("chmod_files", "664")
@@ -103,10 +491,8 @@ class SSHManager:
             options.append(f"--exclude={exclude}")
         
         # Ensure rsync uses the specified SSH key and port
-        remote_shell = f"ssh -i {self.ssh_key_path} -p {self.ssh_port}"
-        if self.non_interactive:
-            remote_shell += " -o BatchMode=yes -o ConnectTimeout=30"
-        options.extend(["-e", remote_shell])
+        # rsync compresses the stream itself with -z, so keep ssh from compressing it again
+        options.extend(["-e", shlex.join([*self._ssh_base, "-o", "Compression=no"])])
         
         # Add --itemize-changes if requested (runtime flag from CLI)
         if self.config.get("_itemize_changes", False):
@@ -117,7 +503,7 @@ class SSHManager:
         if extra_args:
             options.extend(shlex.split(extra_args))
         
-        return options
+        return tuple(options)
 
     def test_connection(self):
         """
@@ -126,14 +512,17 @@ class SSHManager:
         Returns:
             bool: True if connection is successful, False otherwise.
         """
+        if self._connection_ok:
+            return True
+            
         try:
+            # ssh keeps the first value given for an option, so these win over the base's
             cmd = [
                 "ssh",
-                "-i", self.ssh_key_path,
-                "-p", str(self.ssh_port),
                 "-o", "BatchMode=yes",
                 "-o", "ConnectTimeout=5",
-                f"{self.ssh_user}@{self.ssh_host}",
+                *self._ssh_base[1:],
+                self._ssh_target,
                 "echo 'Connection successful'"
             ]
             
@@ -150,13 +539,90 @@ class SSHManager:
                 print(f"SSH connection test failed: {result.stderr}")
                 return False
                 
+            self._connection_ok = True
             return True
             
         except Exception as e:
             print(f"Error testing SSH connection: {e}")
             return False
 
-    def execute_remote_command(self, command, dry_run=False, sudo_password=None, command_collector=None):
+    def _get_paramiko_client(self):
+        """
+        Get the shared in-process SSH client, connecting on first use.
+
+        Returns:
+            paramiko.SSHClient: Connected client, or None if paramiko can't be used.
+        """
+        key = (self.ssh_user, self.ssh_host, self.ssh_port, self.ssh_key_path)
+        if key in _PARAMIKO_CLIENTS:
+            client = _PARAMIKO_CLIENTS[key]
+            if client is None:
+                # An earlier attempt already failed; don't warn again
+                self.backend = "ssh"
+                return None
+            transport = client.get_transport()
+            if transport is not None and transport.is_active():
+                return client
+                
+        try:
+            import paramiko
+        except ImportError:
+            print("Warning: paramiko is not installed, using the ssh binary instead. Install it using 'pip install paramiko'.")
+            _PARAMIKO_CLIENTS[key] = None
+            self.backend = "ssh"
+            return None
+            
+        try:
+            client = paramiko.SSHClient()
+            # Same trust model as the ssh binary in batch mode: only known hosts
+            client.load_system_host_keys()
+            client.set_missing_host_key_policy(paramiko.RejectPolicy())
+            client.connect(
+                self.ssh_host,
+                port=self.ssh_port,
+                username=self.ssh_user,
+                key_filename=os.path.expanduser(self.ssh_key_path),
+                timeout=30
+            )
+        except Exception as e:
+            print(f"Warning: In-process SSH connection failed ({e}), using the ssh binary instead")
+            _PARAMIKO_CLIENTS[key] = None
+            self.backend = "ssh"
+            return None
+            
+        _PARAMIKO_CLIENTS[key] = client
+        return client
+
+    def _execute_paramiko(self, command, stdin_data=None):
+        """
+        Execute a command on the remote server over the in-process SSH connection.
+
+        Args:
+            command (str): Command to execute.
+            stdin_data (str, optional): Data fed to the remote command's stdin.
+
+        Returns:
+            tuple: (success, output) like execute_remote_command, or None if the
+                paramiko backend is unavailable and the ssh binary should be used.
+        """
+        client = self._get_paramiko_client()
+        if client is None:
+            return None
+            
+        stdin, stdout, stderr = client.exec_command(command)
+        if stdin_data is not None:
+            stdin.write(stdin_data)
+        stdin.channel.shutdown_write()
+        
+        output = stdout.read().decode(errors="replace")
+        error_output = stderr.read().decode(errors="replace")
+        if stdout.channel.recv_exit_status() != 0:
+            print(f"Remote command failed: {error_output}")
+            return False, error_output
+            
+        return True, output
+
+    def execute_remote_command(self, command, dry_run=False, sudo_password=None, command_collector=None, stdin_data=None):
         """
         Execute a command on the remote server.
 
@@ -165,19 +631,16 @@ class SSHManager:
             dry_run (bool): If True, only print the command without executing.
             sudo_password (str, optional): Password for sudo commands if needed.
             command_collector (CommandCollector, optional): Collector for command-only mode.
+            stdin_data (str, optional): Data fed to the remote command's stdin.
 
         Returns:
             tuple: (success, output) where success is a boolean and output is the command output.
         """
-        # Check if the command contains sudo
-        is_sudo_command = command.strip().startswith("sudo")
-        
         # Add to command collector if provided
         if command_collector:
-            if is_sudo_command and sudo_password:
+            if sudo_password and command.lstrip().startswith("sudo"):
                 # For sudo commands with password, show a sanitized version
-                sudo_cmd = command.replace("sudo ", "sudo -S ")
-                ssh_cmd = f"echo \"PASSWORD\" | ssh -i {self.ssh_key_path} -p {self.ssh_port} {self.ssh_user}@{self.ssh_host} \"{sudo_cmd}\""
+                ssh_cmd = "echo PASSWORD | " + shlex.join([*self._ssh_base, self._ssh_target, _sudo_from_stdin(command)])
                 command_collector.add_command(
                     ssh_cmd,
                     f"Execute sudo command with password: {command}",
@@ -185,7 +648,7 @@ class SSHManager:
                 )
             else:
                 # Standard SSH command
-                ssh_cmd = f"ssh -i {self.ssh_key_path} -p {self.ssh_port} {self.ssh_user}@{self.ssh_host} '{command}'"
+                ssh_cmd = shlex.join([*self._ssh_base, self._ssh_target, command])
                 command_collector.add_command(
                     ssh_cmd,
                     f"Execute remote command: {command}",
@@ -197,28 +660,30 @@ class SSHManager:
             print(f"[DRY RUN] Would execute remote command: {command}")
             return True, "[DRY RUN] Command execution simulated"
 
+        # Only real executions need to know whether the command runs through sudo
+        is_sudo_command = command.lstrip().startswith("sudo")
+        
         try:
             # If it's a sudo command and we have a password, use a different approach
             if is_sudo_command and sudo_password:
-                # Use sshpass if sudo password is provided
                 print(f"Executing sudo command with password...")
                 
-                # Modify the sudo command to use -S option to read password from stdin
-                sudo_cmd = command.replace("sudo ", "sudo -S ")
+                # On the paramiko backend the password goes straight into the channel's stdin
+                if self.backend == "paramiko":
+                    result = self._execute_paramiko(_sudo_from_stdin(command), f"{sudo_password}\n")
+                    if result is not None:
+                        return result
                 
-                # Create a full command that pipes the password to sudo
-                batch_opt = " -o BatchMode=yes" if self.non_interactive else ""
-                full_cmd = f'echo "{sudo_password}" | ssh -i {self.ssh_key_path} -p {self.ssh_port}{batch_opt} {self.ssh_user}@{self.ssh_host} "{sudo_cmd}"'
+                # Feed the password to 'sudo -S' over ssh's stdin; no local shell involved
+                cmd = [*self._ssh_base, self._ssh_target, _sudo_from_stdin(command)]
                 
-                # Execute the command using shell=True to handle the pipe
                 result = subprocess.run(
-                    full_cmd,
-                    stdin=subprocess.DEVNULL,
+                    cmd,
+                    input=f"{sudo_password}\n",
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
@@ -227,31 +692,24 @@ class SSHManager:
                     
                 return True, result.stdout
             
-            # Standard SSH command execution
-            cmd = [
-                "ssh",
-                "-i", self.ssh_key_path,
-                "-p", str(self.ssh_port),
-            ]
+            # Plain commands can skip the ssh fork entirely on the paramiko backend
+            if self.backend == "paramiko" and not is_sudo_command:
+                result = self._execute_paramiko(command, stdin_data)
+                if result is not None:
+                    return result
             
-            # In non-interactive mode, fail fast instead of prompting for passphrase
-            if self.non_interactive:
-                cmd.extend(["-o", "BatchMode=yes", "-o", "ConnectTimeout=30"])
-            
-            # Add -t flag for pseudo-terminal allocation if it's a sudo command
+            # Standard SSH command execution, with -t for pseudo-terminal allocation
+            # if it's a sudo command and sudo reading a password from stdin if needed
             if is_sudo_command:
-                cmd.append("-t")
-                # Modify the sudo command to use -S option to read password from stdin if needed
-                command = command.replace("sudo ", "sudo -S ")
-            
-            cmd.extend([
-                f"{self.ssh_user}@{self.ssh_host}",
-                command
-            ])
+                cmd = [*self._ssh_base, "-t", self._ssh_target, _sudo_from_stdin(command)]
+            else:
+                cmd = [*self._ssh_base, self._ssh_target, command]
             
+            # Feed stdin_data to the remote command when given, otherwise keep stdin closed
+            stdin_args = {"input": stdin_data} if stdin_data is not None else {"stdin": subprocess.DEVNULL}
             result = subprocess.run(
                 cmd,
-                stdin=subprocess.DEVNULL,
+                **stdin_args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -267,7 +725,121 @@ class SSHManager:
         except Exception as e:
             print(f"Error executing remote command: {e}")
             return False, str(e)
+
+    def execute_remote_commands(self, commands, sudo=False, sudo_password=None, dry_run=False, command_collector=None):
+        """
+        Execute several commands on the remote server in a single SSH session.
+
+        The commands are joined into a script run by one remote 'sh -c', each followed
+        by a marker carrying its exit status, so N related commands cost one connection
+        instead of N. Execution stops at the first command that fails.
+
+        Args:
+            commands (list): Commands to execute, in order.
+            sudo (bool): If True, run the whole script through sudo.
+            sudo_password (str, optional): Password for sudo, the only thing fed on stdin.
+            dry_run (bool): If True, only print the commands without executing.
+            command_collector (CommandCollector, optional): Collector for command-only mode.
+
+        Returns:
+            tuple: (success, output) where success is a boolean and output is a list of
+                (exit status, output) pairs for the commands that ran, or the error output.
+        """
+        if command_collector:
+            for command in commands:
+                command_collector.add_command(
+                    shlex.join([*self._ssh_base, self._ssh_target, f"sudo {command}" if sudo else command]),
+                    f"Execute remote command: {command}",
+                    "remote"
+                )
+            return True, [(0, "[COMMAND ONLY] Command execution simulated") for _ in commands]
+            
+        if dry_run:
+            for command in commands:
+                print(f"[DRY RUN] Would execute remote command: {command}")
+            return True, [(0, "[DRY RUN] Command execution simulated") for _ in commands]
+
+        # Each command gets /dev/null as stdin so it can't swallow the rest of the script
+        script = "".join(
+            f"{{ {command}\n}} </dev/null\nrc=$?\necho \"{_COMMAND_SEPARATOR}$rc\"\n[ $rc -eq 0 ] || exit $rc\n"
+            for command in commands
+        )
+        # The script goes in as an argument, so a password sudo doesn't read (cached
+        # timestamp, NOPASSWD rule) is never run as a command
+        remote_cmd = f"sh -c {shlex.quote(script)}"
+        stdin_data = None
+        if sudo and sudo_password:
+            remote_cmd = _sudo_from_stdin(f"sudo {remote_cmd}")
+            stdin_data = f"{sudo_password}\n"
+        elif sudo:
+            remote_cmd = f"sudo -n {remote_cmd}"
+            
+        try:
+            result = subprocess.run(
+                [*self._ssh_base, self._ssh_target, remote_cmd],
+                input=stdin_data if stdin_data is not None else "",
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False
+            )
+            
+            if result.returncode != 0:
+                print(f"Remote command failed: {result.stderr}")
+                return False, result.stderr
+                
+            # Each marker ends one command's output and its status line starts the next's
+            parts = result.stdout.split(_COMMAND_SEPARATOR)
+            results = []
+            output = parts[0]
+            for part in parts[1:]:
+                status, _, next_output = part.partition("\n")
+                results.append((int(status), output))
+                output = next_output
+                
+            return True, results
             
+        except Exception as e:
+            print(f"Error executing remote commands: {e}")
+            return False, str(e)
+
+    def stream_remote_command(self, command, stdin=None, stdout=None):
+        """
+        Execute a command on the remote server with its stdin/stdout wired to local streams.
+
+        This lets large payloads (e.g. SQL dumps) flow straight through the SSH
+        channel instead of being staged in a remote file and copied with scp.
+
+        Args:
+            command (str): Command to execute.
+            stdin (file, optional): Local file object fed to the remote command's stdin.
+            stdout (file, optional): Local file object receiving the remote command's stdout.
+
+        Returns:
+            tuple: (success, output) where success is a boolean and output is the command's stderr.
+        """
+        try:
+            cmd = [*self._ssh_base, self._ssh_target, command]
+
+            process = subprocess.Popen(
+                cmd,
+                stdin=stdin if stdin is not None else subprocess.DEVNULL,
+                stdout=stdout if stdout is not None else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            _, stderr = process.communicate()
+
+            if process.returncode != 0:
+                print(f"Remote command failed: {stderr}")
+                return False, stderr
+
+            return True, stderr
+
+        except Exception as e:
+            print(f"Error executing remote command: {e}")
+            return False, str(e)
+
     def execute_as_sudo_user(self, command, dry_run=False, command_collector=None, sudo_password=None):
         """
         Execute a command on the remote server as the sudo user.
@@ -292,7 +864,7 @@ class SSHManager:
         # Add to command collector if provided
         if command_collector:
             # For command collector mode, always show the command without sudo
-            ssh_cmd = f"ssh -i {self.sudo_key_path} -p {self.ssh_port} {self.sudo_user}@{self.ssh_host} '{command}'"
+            ssh_cmd = shlex.join([*self._sudo_ssh_base, self._sudo_ssh_target, command])
             command_collector.add_command(
                 ssh_cmd,
                 f"Execute as sudo user '{self.sudo_user}': {command}",
@@ -309,13 +881,7 @@ class SSHManager:
             print(f"Executing command as sudo user {self.sudo_user}...")
             
             # Build SSH command to execute as sudo user
-            cmd = [
-                "ssh",
-                "-i", self.sudo_key_path,
-                "-p", str(self.ssh_port),
-                f"{self.sudo_user}@{self.ssh_host}",
-                command
-            ]
+            cmd = [*self._sudo_ssh_base, self._sudo_ssh_target, command]
             
             result = subprocess.run(
                 cmd,
@@ -331,53 +897,41 @@ class SSHManager:
                 print(f"Direct command execution as sudo user failed: {result.stderr}")
                 print(f"Trying with sudo for user {self.sudo_user}...")
                 
-                # Check if sudo requires password
-                if not sudo_password:
-                    # First try without password (in case NOPASSWD sudo is configured)
-                    check_cmd = "sudo -n true 2>/dev/null && echo 'NOPASSWD' || echo 'PASSWORD'"
-                    check_result = subprocess.run(
-                        ["ssh", "-i", self.sudo_key_path, "-p", str(self.ssh_port), f"{self.sudo_user}@{self.ssh_host}", check_cmd],
+                # Without a password, run the command under 'sudo -n' straight away rather
+                # than probing first: with NOPASSWD sudo this is the only call needed, and
+                # otherwise sudo fails fast without running anything
+                if not sudo_password and self._nopasswd_cache.get(self.sudo_user, True):
+                    sudo_result = subprocess.run(
+                        [*self._sudo_ssh_base, self._sudo_ssh_target, f"sudo -n {command}"],
                         stdin=subprocess.DEVNULL,
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True,
                         check=False
                     )
-                    
-                    if check_result.returncode == 0 and "NOPASSWD" in check_result.stdout:
+                    nopasswd = sudo_result.returncode == 0 or "password is required" not in sudo_result.stderr
+                    self._nopasswd_cache[self.sudo_user] = nopasswd
+                    if nopasswd:
                         print(f"NOPASSWD sudo is available for user {self.sudo_user}.")
-                    elif self.non_interactive:
+                
+                # Ask for the password only once sudo has said it needs one
+                if not sudo_password and not self._nopasswd_cache[self.sudo_user]:
+                    if self.non_interactive:
                         print(f"Sudo password required for user {self.sudo_user} but running in non-interactive mode.")
                         print("Pass --sudo-password-stdin or configure NOPASSWD sudo for this user.")
                         return False, "No password provided (non-interactive)"
-                    else:
-                        print(f"Sudo password required for user {self.sudo_user}. Please enter it below.")
-                        sudo_password = self.password_manager.get_sudo_password()
-                        if not sudo_password:
-                            print("No password provided. Cannot proceed.")
-                            return False, "No password provided"
+                    print(f"Sudo password required for user {self.sudo_user}. Please enter it below.")
+                    sudo_password = self.password_manager.get_sudo_password()
+                    if not sudo_password:
+                        print("No password provided. Cannot proceed.")
+                        return False, "No password provided"
                 
-                # Try with sudo
+                # Try with sudo, the password fed over ssh's stdin
                 if sudo_password:
-                    # Use sudo with password
-                    sudo_cmd = f"sudo -S {command}"
-                    full_cmd = f'echo "{sudo_password}" | ssh -i {self.sudo_key_path} -p {self.ssh_port} {self.sudo_user}@{self.ssh_host} "{sudo_cmd}"'
-                    
-                    sudo_result = subprocess.run(
-                        full_cmd,
-                        stdin=subprocess.DEVNULL,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=False,
-                        shell=True
-                    )
-                else:
-                    # Use sudo without password
-                    sudo_cmd = f"sudo {command}"
+                    sudo_cmd = _sudo_from_stdin(f"sudo {command}")
                     sudo_result = subprocess.run(
-                        ["ssh", "-i", self.sudo_key_path, "-p", str(self.ssh_port), f"{self.sudo_user}@{self.ssh_host}", sudo_cmd],
-                        stdin=subprocess.DEVNULL,
+                        [*self._sudo_ssh_base, self._sudo_ssh_target, sudo_cmd],
+                        input=f"{sudo_password}\n",
                         stdout=subprocess.PIPE,
                         stderr=subprocess.PIPE,
                         text=True,
@@ -475,25 +1029,14 @@ class SSHManager:
             print(f"Ensuring backup directory exists: {backup_dir}")
             
             if direction == "push":
-                # For push, the backup directory is on the remote server
-                # First check if the directory exists
-                check_cmd = f"test -d {backup_dir} && echo 'EXISTS' || echo 'NOT_EXISTS'"
-                success, output = self.execute_remote_command(check_cmd)
+                # For push, the backup directory is on the remote server.
+                # mkdir -p is idempotent, so no separate existence check is needed.
+                mkdir_cmd = f"mkdir -p {shlex.quote(backup_dir)}"
+                success, output = self.execute_remote_command(mkdir_cmd)
                 
                 if not success:
-                    print(f"Failed to check if backup directory exists: {output}")
+                    print(f"Failed to create backup directory: {output}")
                     return False
-                    
-                if "EXISTS" not in output:
-                    # Directory doesn't exist, create it
-                    mkdir_cmd = f"mkdir -p {backup_dir}"
-                    success, output = self.execute_remote_command(mkdir_cmd)
-                    
-                    if not success:
-                        print(f"Failed to create backup directory: {output}")
-                        return False
-                        
-                    print(f"Created backup directory on remote server: {backup_dir}")
             else:
                 # For pull, the backup directory is on the local system
                 if not os.path.exists(backup_dir):
@@ -526,15 +1069,30 @@ class SSHManager:
             if not dry_run:
                 self._cleanup_destination_files(direction, sudo_password=sudo_password)
                 
-            # Ensure backup directory exists if backup is enabled
+            # Ensure backup directory exists if backup is enabled. On push the remote
+            # rsync creates it before starting, saving a separate ssh call
+            rsync_path_args = []
             if not self.config.get("no_backup", False) and not self.config.get("no_trash", False) and not dry_run:
-                self._ensure_backup_dir_exists(direction)
+                if direction == "push":
+                    backup_dir = self._get_backup_dir(self.config)
+                    if backup_dir:
+                        rsync_path_args.append(f"--rsync-path=mkdir -p {shlex.quote(backup_dir)} && rsync")
+                else:
+                    self._ensure_backup_dir_exists(direction)
+            
+            # Optionally copy the bulk of the data over several rsync streams first;
+            # the regular pass below then only handles deletions and stragglers
+            parallel_workers = int(self.config["rsync"].get("parallel_workers", 1))
+            if parallel_workers > 1 and not dry_run and not command_collector:
+                if not self.transfer_files_parallel(direction, parallel_workers, rsync_path_args):
+                    print("Parallel transfer incomplete, continuing with a single rsync pass")
             
             # Build rsync command
             rsync_cmd = ["rsync"]
             
             # Add options
-            rsync_cmd.extend(self.rsync_options)
+            rsync_cmd.extend(self.get_rsync_options())
+            rsync_cmd.extend(rsync_path_args)
             
             # Add dry run flag if needed
             # The dry_run parameter passed to this method takes precedence over the config
@@ -544,9 +1102,9 @@ class SSHManager:
                 rsync_cmd.append("--dry-run")
                 
             # Set source and destination based on direction
-            # Ensure paths end with trailing slash for proper rsync directory handling
-            local_path = self.local_path if self.local_path.endswith('/') else f"{self.local_path}/"
-            live_path = self.live_path if self.live_path.endswith('/') else f"{self.live_path}/"
+            # Paths end with a trailing slash for proper rsync directory handling
+            local_path = self._local_path_slash
+            live_path = self._live_path_slash
             
             if direction == "push":
                 source = local_path
@@ -577,44 +1135,13 @@ class SSHManager:
                 rsync_cmd,
                 stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1  # Line buffered
+                stderr=subprocess.PIPE
             )
             
-            # Stream stdout and stderr in real-time
-            stdout_lines = []
-            stderr_lines = []
-            
-            # Function to handle output streams
-            def process_stream(stream, lines_list):
-                for line in iter(stream.readline, ''):
-                    if not line:
-                        break
-                    print(line.rstrip())
-                    lines_list.append(line)
-            
-            # Process stdout and stderr
-            import threading
-            stdout_thread = threading.Thread(target=process_stream, args=(process.stdout, stdout_lines))
-            stderr_thread = threading.Thread(target=process_stream, args=(process.stderr, stderr_lines))
-            
-            stdout_thread.start()
-            stderr_thread.start()
-            
-            # Wait for process to complete
+            stderr_output = _relay_output(process)
             return_code = process.wait()
             
-            # Wait for threads to complete
-            stdout_thread.join()
-            stderr_thread.join()
-            
-            # Close file descriptors
-            process.stdout.close()
-            process.stderr.close()
-            
             if return_code != 0:
-                stderr_output = ''.join(stderr_lines)
                 print(f"File transfer failed: {stderr_output}")
                 return False
                 
@@ -624,6 +1151,105 @@ class SSHManager:
             print(f"Error transferring files: {e}")
             return False
 
+    def _list_source_files(self, direction):
+        """
+        List the files to transfer with their sizes.
+
+        Args:
+            direction (str): Direction of transfer ('push' or 'pull').
+
+        Returns:
+            list: (size, relative path) tuples, or None if listing failed.
+        """
+        files = []
+        if direction == "push":
+            root = self._local_path_slash
+            for dirpath, _, filenames in os.walk(root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        size = os.lstat(path).st_size
+                    except OSError:
+                        continue
+                    files.append((size, os.path.relpath(path, root)))
+            return files
+            
+        cmd = f"find {shlex.quote(self._live_path_slash)} -type f -printf '%s %P\\0'"
+        success, output = self.execute_remote_command(cmd)
+        if not success:
+            return None
+        for entry in output.split("\0"):
+            if entry:
+                size, _, rel_path = entry.partition(" ")
+                files.append((int(size), rel_path))
+        return files
+
+    def transfer_files_parallel(self, direction, workers, extra_options=()):
+        """
+        Copy the source tree over several concurrent rsync streams.
+
+        The files are split into size-balanced groups, each sent by its own rsync
+        with --files-from over the shared SSH master connection. Deletions are left
+        to the regular rsync pass that follows, which also catches anything missed.
+
+        Args:
+            direction (str): Direction of transfer ('push' or 'pull').
+            workers (int): Number of concurrent rsync processes.
+            extra_options (list, optional): Additional rsync options for every stream.
+
+        Returns:
+            bool: True if every stream succeeded, False otherwise.
+        """
+        files = self._list_source_files(direction)
+        if files is None:
+            print("Failed to list source files for parallel transfer")
+            return False
+            
+        excludes = self.config["rsync"].get("excludes", [])
+        files = [(size, path) for size, path in files if not _is_excluded(path, excludes)]
+        if not files:
+            return True
+            
+        # Largest files first, each into the currently lightest group
+        groups = [(0, i, []) for i in range(workers)]
+        for size, path in sorted(files, reverse=True):
+            total, i, paths = heapq.heappop(groups)
+            paths.append(path)
+            heapq.heappush(groups, (total + size, i, paths))
+            
+        # Deletion and per-file progress belong to the final pass
+        skip = {"--delete", "--delete-after", "--progress", "--info=progress2", "--verbose"}
+        options = [opt for opt in self.get_rsync_options() if opt not in skip]
+        options.extend(extra_options)
+        if direction == "push":
+            source = self._local_path_slash
+            dest = f"{self.ssh_user}@{self.ssh_host}:{self._live_path_slash}"
+        else:
+            source = f"{self.ssh_user}@{self.ssh_host}:{self._live_path_slash}"
+            dest = self._local_path_slash
+            
+        def run_group(paths):
+            with tempfile.NamedTemporaryFile("w", prefix="wpsync-files-", suffix=".lst") as file_list:
+                file_list.write("\0".join(paths))
+                file_list.flush()
+                result = subprocess.run(
+                    ["rsync", *options, "--from0", f"--files-from={file_list.name}", source, dest],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    check=False
+                )
+            if result.returncode != 0:
+                print(f"Parallel rsync stream failed: {result.stderr}")
+            return result.returncode == 0
+            
+        print(f"Transferring {len(files)} files over {workers} parallel rsync streams...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_group, [paths for _, _, paths in groups if paths]))
+            
+        return all(results)
+
     def set_permissions(self, sudo_password=None, command_collector=None):
         """
         Set file permissions on the remote server.
@@ -644,80 +1270,52 @@ class SSHManager:
             
             print("Setting file permissions on remote server...")
             
+            # The chown and then a single find walk that chmods directories and
+            # files, batching paths per chmod with '+', all in one remote shell
+            live_path = shlex.quote(self.live_path)
+            chown_cmd = f"chown -R {shlex.quote(f'{user}:{group}')} {live_path}"
+            chmod_cmd = f"find {live_path} -type d -exec chmod 755 {{}} + -o -type f -exec chmod 644 {{}} +"
+            permissions_cmd = "sh -c " + shlex.quote(f"{chown_cmd} && {chmod_cmd}")
+            
             # Check if we have a dedicated sudo user configured
             if self.sudo_user:
                 print(f"Using dedicated sudo user '{self.sudo_user}' for permission operations...")
                 
-                # Set ownership
-                print("Setting ownership...")
-                chown_cmd = f"chown -R {user}:{group} {self.live_path}"
-                success, output = self.execute_as_sudo_user(chown_cmd, command_collector=command_collector, sudo_password=sudo_password)
+                print("Setting ownership and permissions...")
+                success, output = self.execute_as_sudo_user(permissions_cmd, command_collector=command_collector, sudo_password=sudo_password)
                 if not success and not command_collector:
-                    print(f"Failed to set ownership: {output}")
-                    return False
-                
-                # Set directory permissions
-                print("Setting directory permissions...")
-                chmod_dirs_cmd = f"find {self.live_path} -type d -exec chmod 755 {{}} \\;"
-                success, output = self.execute_as_sudo_user(chmod_dirs_cmd, command_collector=command_collector, sudo_password=sudo_password)
-                if not success and not command_collector:
-                    print(f"Failed to set directory permissions: {output}")
-                    return False
-                    
-                # Set file permissions
-                print("Setting file permissions...")
-                chmod_files_cmd = f"find {self.live_path} -type f -exec chmod 644 {{}} \\;"
-                success, output = self.execute_as_sudo_user(chmod_files_cmd, command_collector=command_collector, sudo_password=sudo_password)
-                if not success and not command_collector:
-                    print(f"Failed to set file permissions: {output}")
+                    print(f"Failed to set ownership and permissions: {output}")
                     return False
                 
             else:
-                # No dedicated sudo user, use regular user with sudo
+                # No dedicated sudo user, use regular user with sudo. Without a password
+                # the commands go straight to 'sudo -n', which succeeds with NOPASSWD sudo
+                # and otherwise fails without running anything, so no separate probe is needed
+                print("Setting ownership and permissions...")
+                needs_password = not sudo_password and self._nopasswd_cache.get(self.ssh_user) is False
+                if not needs_password:
+                    success, output = self.execute_remote_commands([chown_cmd, chmod_cmd], sudo=True, sudo_password=sudo_password)
+                    needs_password = not success and not sudo_password and "password is required" in output
+                    if not sudo_password:
+                        self._nopasswd_cache[self.ssh_user] = not needs_password
+                
                 # If sudo_password is not provided, try to prompt for it
-                if not sudo_password:
-                    # First try without password (in case NOPASSWD sudo is configured)
-                    print("Checking if sudo password is required...")
-                    check_cmd = "sudo -n true 2>/dev/null && echo 'NOPASSWD' || echo 'PASSWORD'"
-                    success, check_output = self.execute_remote_command(check_cmd)
-                    
-                    if success and "NOPASSWD" in check_output:
-                        print("NOPASSWD sudo is available, no password needed.")
-                    elif self.non_interactive:
+                if needs_password:
+                    if self.non_interactive:
                         print("Sudo password required but running in non-interactive mode.")
                         print("Pass --sudo-password-stdin or configure NOPASSWD sudo for this user.")
                         return False
-                    else:
-                        print("Sudo password required. Please enter it below.")
-                        sudo_password = self.password_manager.get_sudo_password()
-                        if not sudo_password:
-                            print("No password provided. Cannot proceed.")
-                            print("You can also configure NOPASSWD sudo by adding this line to /etc/sudoers using visudo:")
-                            print(f"{self.ssh_user} ALL=(ALL) NOPASSWD: ALL")
-                            return False
-                
-                # Set ownership
-                print("Setting ownership...")
-                chown_cmd = f"sudo chown -R {user}:{group} {self.live_path}"
-                success, output = self.execute_remote_command(chown_cmd, sudo_password=sudo_password)
-                if not success:
-                    print(f"Failed to set ownership: {output}")
-                    return False
+                    print("Sudo password required. Please enter it below.")
+                    sudo_password = self.password_manager.get_sudo_password()
+                    if not sudo_password:
+                        print("No password provided. Cannot proceed.")
+                        print("You can also configure NOPASSWD sudo by adding this line to /etc/sudoers using visudo:")
+                        print(f"{self.ssh_user} ALL=(ALL) NOPASSWD: ALL")
+                        return False
+                    success, output = self.execute_remote_commands([chown_cmd, chmod_cmd], sudo=True, sudo_password=sudo_password)
                 
-                # Set directory permissions
-                print("Setting directory permissions...")
-                chmod_dirs_cmd = f"sudo find {self.live_path} -type d -exec chmod 755 {{}} \\;"
-                success, output = self.execute_remote_command(chmod_dirs_cmd, sudo_password=sudo_password)
                 if not success:
-                    print(f"Failed to set directory permissions: {output}")
-                    return False
-                    
-                # Set file permissions
-                print("Setting file permissions...")
-                chmod_files_cmd = f"sudo find {self.live_path} -type f -exec chmod 644 {{}} \\;"
-                success, output = self.execute_remote_command(chmod_files_cmd, sudo_password=sudo_password)
-                if not success:
-                    print(f"Failed to set file permissions: {output}")
+                    print(f"Failed to set ownership and permissions: {output}")
                     return False
             
             print("File permissions set successfully.")
@@ -753,67 +1351,63 @@ class SSHManager:
             # Determine destination path based on direction
             if direction == "push":
                 # Destination is remote
-                for file_pattern in cleanup_files:
-                    print(f"Cleaning up {file_pattern} files on remote server...")
-                    # Use find to locate and delete files matching the pattern
-                    # Check if we have permission to delete files directly
-                    test_cmd = f"test -w {self.live_path} && echo 'WRITABLE' || echo 'NOT_WRITABLE'"
-                    success, test_output = self.execute_remote_command(test_cmd)
-                    
-                    # Check if we have a dedicated sudo user configured
-                    if self.sudo_user:
-                        print(f"Using dedicated sudo user '{self.sudo_user}' for cleanup...")
-                        cmd = f"find {self.live_path} -name '{file_pattern}' -type f -delete"
-                        success, output = self.execute_as_sudo_user(cmd, sudo_password=sudo_password, command_collector=command_collector)
-                    elif success and "WRITABLE" in test_output:
-                        # We have write permission, use regular find command
-                        cmd = f"find {self.live_path} -name '{file_pattern}' -type f -delete"
-                        success, output = self.execute_remote_command(cmd)
-                    else:
-                        # We don't have write permission, use sudo with regular user
-                        if not sudo_password:
-                            # Try to check if NOPASSWD sudo is available
-                            check_cmd = "sudo -n true 2>/dev/null && echo 'NOPASSWD' || echo 'PASSWORD'"
-                            success, check_output = self.execute_remote_command(check_cmd)
-                            
-                            if not (success and "NOPASSWD" in check_output):
-                                if self.non_interactive:
-                                    print("Sudo password required for cleanup but running in non-interactive mode. Skipping.")
-                                    continue
-                                # Need password - prompt for it
-                                print("Sudo password required for cleanup. Please enter it below.")
-                                sudo_password = self.password_manager.get_sudo_password()
-                                if not sudo_password:
-                                    print("No password provided. Skipping cleanup.")
-                                    continue
-                        
-                        cmd = f"sudo find {self.live_path} -name '{file_pattern}' -type f -delete"
-                        success, output = self.execute_remote_command(cmd, sudo_password=sudo_password)
+                print(f"Cleaning up {', '.join(cleanup_files)} files on remote server...")
+                # One find walk matches every pattern, instead of a walk per pattern
+                name_expr = "\\( " + " -o ".join(f"-name {shlex.quote(pattern)}" for pattern in cleanup_files) + " \\)"
+                live_path = shlex.quote(self.live_path)
+                cmd = f"find {live_path} {name_expr} -type f -delete"
+                
+                # Check if we have a dedicated sudo user configured
+                if self.sudo_user:
+                    print(f"Using dedicated sudo user '{self.sudo_user}' for cleanup...")
+                    success, output = self.execute_as_sudo_user(cmd, sudo_password=sudo_password, command_collector=command_collector)
+                else:
+                    # A single call deletes directly if we can write to the site root and
+                    # otherwise through sudo, provided it needs no password
+                    success, output = self.execute_remote_command(
+                        f"{{ test -w {live_path} && {cmd}; }} 2>/dev/null || sudo -n {cmd}"
+                    )
                     
+                    # Only fall back to password sudo if that single call failed, and remember
+                    # that sudo wants a password so later sudo calls skip straight to it
                     if not success:
-                        print(f"Warning: Failed to clean up {file_pattern} files: {output}")
-                        # Try alternative approach if sudo failed
-                        if "sudo" in cmd:
-                            print("Trying alternative approach without sudo...")
-                            alt_cmd = f"find {self.live_path} -name '{file_pattern}' -type f -print0 | xargs -0 rm -f 2>/dev/null || true"
-                            self.execute_remote_command(alt_cmd)
+                        if "password is required" in output:
+                            self._nopasswd_cache[self.ssh_user] = False
+                        if not sudo_password and not self.non_interactive:
+                            print("Sudo password required for cleanup. Please enter it below.")
+                            sudo_password = self.password_manager.get_sudo_password()
+                        if sudo_password:
+                            cmd = f"sudo {cmd}"
+                            success, output = self.execute_remote_command(cmd, sudo_password=sudo_password)
+                        elif self.non_interactive:
+                            print("Sudo password required for cleanup but running in non-interactive mode. Skipping.")
+                            return True
+                        else:
+                            print("No password provided. Skipping cleanup.")
+                            return True
+                
+                if not success:
+                    print(f"Warning: Failed to clean up {', '.join(cleanup_files)} files: {output}")
+                    # Try alternative approach if sudo failed
+                    if "sudo" in cmd:
+                        print("Trying alternative approach without sudo...")
+                        alt_cmd = f"find {live_path} {name_expr} -type f -print0 | xargs -0 rm -f 2>/dev/null || true"
+                        self.execute_remote_command(alt_cmd)
             else:
                 # Destination is local
-                for file_pattern in cleanup_files:
-                    print(f"Cleaning up {file_pattern} files on local system...")
-                    # Use find to locate and delete files matching the pattern
-                    cmd = f"find {self.local_path} -name '{file_pattern}' -type f -delete"
-                    result = subprocess.run(
-                        cmd,
-                        stdin=subprocess.DEVNULL,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=False,
-                        shell=True
-                    )
-                    if result.returncode != 0:
-                        print(f"Warning: Failed to clean up {file_pattern} files: {result.stderr}")
+                print(f"Cleaning up {', '.join(cleanup_files)} files on local system...")
+                # One walk in-process matches every pattern; no find or shell to fork
+                paths = list(_find_matching_files(self.local_path, cleanup_files))
+                
+                # Unlinking is syscall-bound, so large sets are deleted by a pool of threads
+                if len(paths) < _PARALLEL_UNLINK_MIN:
+                    errors = map(_unlink, paths)
+                else:
+                    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                        errors = list(executor.map(_unlink, paths))
+                for path, error in zip(paths, errors):
+                    if error:
+                        print(f"Warning: Failed to clean up {path}: {error}")
                         
             return True
             
@@ -823,13 +1417,17 @@ class SSHManager:
             
     def transfer_file(self, source_path, dest_path, direction, dry_run=False, command_collector=None):
         """
-        Transfer a single file between local and remote servers using scp.
+        Transfer a single file between local and remote servers using rsync.
+
+        The copy is compressed on the wire, reuses the multiplexed SSH
+        connection, and resumes from the partial file after a dropped connection.
 
         Args:
             source_path (str): Source file path.
             dest_path (str): Destination file path.
             direction (str): Direction of transfer ('push' or 'pull').
             dry_run (bool): If True, only print the command without executing.
+            command_collector (CommandCollector, optional): Collector for command-only mode.
 
         Returns:
             bool: True if transfer is successful, False otherwise.
@@ -839,39 +1437,27 @@ class SSHManager:
             return True
 
         try:
-            # Build scp command
-            scp_cmd = ["scp", "-i", self.ssh_key_path, "-P", str(self.ssh_port)]
-            if self.non_interactive:
-                scp_cmd.extend(["-o", "BatchMode=yes", "-o", "ConnectTimeout=30"])
-            
             # Set source and destination based on direction
             if direction == "push":
-                source = source_path
-                dest = f"{self.ssh_user}@{self.ssh_host}:{dest_path}"
+                transfer_cmd = [*self._file_transfer_base, source_path, f"{self._ssh_target}:{dest_path}"]
             else:  # pull
-                source = f"{self.ssh_user}@{self.ssh_host}:{source_path}"
-                dest = dest_path
-                
-            # Add source and destination to command
-            scp_cmd.append(source)
-            scp_cmd.append(dest)
+                transfer_cmd = [*self._file_transfer_base, f"{self._ssh_target}:{source_path}", dest_path]
             
             # Add to command collector if provided
             if command_collector:
-                scp_cmd_str = ' '.join(scp_cmd)
                 command_collector.add_command(
-                    scp_cmd_str,
+                    shlex.join(transfer_cmd),
                     f"Transfer single file {'to remote' if direction == 'push' else 'from remote'}: {source_path} to {dest_path}",
                     "both"
                 )
                 return True
             
-            # Execute scp command
-            print(f"Executing: {' '.join(scp_cmd)}")
+            # Execute rsync command; only its stderr is of any use, so stdout isn't kept
+            print(f"Executing: {' '.join(transfer_cmd)}")
             result = subprocess.run(
-                scp_cmd,
+                transfer_cmd,
                 stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
                 check=False
@@ -7,9 +7,11 @@ correct URL mapping after synchronization between environments.
 """
 
 import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
+from resources.wp_cli import WP_BIN
 
 
 class URLManager:
@@ -128,7 +130,7 @@ class URLManager:
             from resources.ssh_manager import SSHManager
             ssh_manager = SSHManager(self.config)
             
-            cmd = f'wp --path="{path}" search-replace "{search_url}" "{replace_url}" --all-tables --allow-root'
+            cmd = f"wp {shlex.quote(f'--path={path}')} search-replace {shlex.quote(search_url)} {shlex.quote(replace_url)} --all-tables --allow-root"
             success, output = ssh_manager.execute_remote_command(cmd)
             
             if not success:
@@ -139,14 +141,13 @@ class URLManager:
             return True
         else:
             try:
-                cmd = f'wp --path="{path}" search-replace "{search_url}" "{replace_url}" --all-tables --allow-root'
+                cmd = [WP_BIN, f"--path={path}", "search-replace", search_url, replace_url, "--all-tables", "--allow-root"]
                 result = subprocess.run(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
@@ -226,7 +227,7 @@ class URLManager:
             from resources.ssh_manager import SSHManager
             ssh_manager = SSHManager(self.config)
             
-            cmd = f'wp --path="{path}" option get siteurl --allow-root'
+            cmd = f"wp {shlex.quote(f'--path={path}')} option get siteurl --allow-root"
             success, output = ssh_manager.execute_remote_command(cmd)
             
             if not success:
@@ -236,14 +237,13 @@ class URLManager:
             return output.strip()
         else:
             try:
-                cmd = f'wp --path="{path}" option get siteurl --allow-root'
+                cmd = [WP_BIN, f"--path={path}", "option", "get", "siteurl", "--allow-root"]
                 result = subprocess.run(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
@@ -271,7 +271,7 @@ class URLManager:
             from resources.ssh_manager import SSHManager
             ssh_manager = SSHManager(self.config)
             
-            cmd = f'wp --path="{path}" option get home --allow-root'
+            cmd = f"wp {shlex.quote(f'--path={path}')} option get home --allow-root"
             success, output = ssh_manager.execute_remote_command(cmd)
             
             if not success:
@@ -281,14 +281,13 @@ class URLManager:
             return output.strip()
         else:
             try:
-                cmd = f'wp --path="{path}" option get home --allow-root'
+                cmd = [WP_BIN, f"--path={path}", "option", "get", "home", "--allow-root"]
                 result = subprocess.run(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
@@ -6,16 +6,152 @@ This module performs validation checks after synchronization to ensure everythin
 is functioning correctly, including core files, database, and accessibility.
 """
 
+import io
+import json
 import os
+import shlex
 import subprocess
 import sys
-import requests
+import threading
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from urllib3.exceptions import InsecureRequestWarning
+from resources.ssh_manager import SSHManager
+from resources.wp_cli import WP_BIN
 
-# Suppress InsecureRequestWarning for validation checks
-warnings.simplefilter('ignore', InsecureRequestWarning)
+
+def _requests():
+    """
+    Import requests on first use, since only the accessibility checks need it.
+
+    Returns:
+        module: The requests module.
+    """
+    import requests
+    from urllib3.exceptions import InsecureRequestWarning
+
+    # Suppress InsecureRequestWarning for validation checks
+    warnings.simplefilter('ignore', InsecureRequestWarning)
+    return requests
+
+
+# Upper bound on checks run at once by a single _run_checks call
+_MAX_PARALLEL_CHECKS = 8
+
+# Upper bound on remote commands in flight at once; they share one multiplexed
+# SSH connection, which sshd limits to MaxSessions (10 by default) channels
+_MAX_REMOTE_CHECKS = 4
+
+# Core file fingerprints from the last passing 'wp core verify-checksums' per site
+_CHECKSUM_CACHE_PATH = os.path.expanduser("~/.wordpress-sync/validation-cache.json")
+
+# Prints "<file count> <total size> <sum of mtimes>" for the core files, run from the
+# WordPress root; the remote counterpart of _core_files_fingerprint's local scan
+_CORE_FINGERPRINT_SH = (
+    "{ find wp-admin wp-includes -type f -printf '%s %T@\\n'; "
+    "find . -maxdepth 1 -type f -name '*.php' -printf '%s %T@\\n'; } "
+    "| awk '{n++; s+=$1; t+=int($2)} END {printf \"%d %d %.0f\\n\", n, s, t}'"
+)
+
+# Core WordPress tables, without the table prefix
+_CORE_TABLE_SUFFIXES = frozenset((
+    "commentmeta",
+    "comments",
+    "links",
+    "options",
+    "postmeta",
+    "posts",
+    "terms",
+    "term_relationships",
+    "term_taxonomy",
+    "usermeta",
+    "users"
+))
+
+# Reports the table prefix and every table in the database as JSON, so one
+# 'wp eval' (one WordPress bootstrap) covers both lookups
+_DB_PROBE_PHP = (
+    'global $wpdb; '
+    'echo json_encode(array("prefix" => $wpdb->base_prefix, "tables" => $wpdb->get_col("SHOW TABLES")));'
+)
+
+
+def _write_lines(lines):
+    """
+    Write buffered output with a single write call, then empty the buffer.
+
+    Args:
+        lines (list): Output chunks, each ending in a newline.
+    """
+    if lines:
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
+        lines.clear()
+
+
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout that collects each capturing thread's output separately.
+
+    Threads that aren't capturing write straight through to the wrapped stream.
+    """
+
+    def __init__(self, stream):
+        """
+        Initialize the output router.
+
+        Args:
+            stream: The stream to write uncaptured output to.
+        """
+        self.stream = stream
+        self._local = threading.local()
+        self._users = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Install the router as sys.stdout, or add a user if it already is installed."""
+        with self._lock:
+            if self._users == 0:
+                sys.stdout = self
+            self._users += 1
+
+    def release(self):
+        """Drop a user, putting the wrapped stream back once the last one is gone."""
+        with self._lock:
+            self._users -= 1
+            if self._users == 0 and sys.stdout is self:
+                sys.stdout = self.stream
+
+    def capture(self, func, *args):
+        """
+        Call a function, collecting everything the current thread prints meanwhile.
+
+        Args:
+            func (callable): Function to call.
+            *args: Arguments for the function.
+
+        Returns:
+            tuple: (return value, captured output)
+        """
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            result = func(*args)
+        finally:
+            self._local.buffer = None
+        return result, buffer.getvalue()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
 
 
 class ValidationManager:
@@ -32,6 +168,19 @@ class ValidationManager:
         self.local_path = config["paths"]["local"]
         self.live_path = config["paths"]["live"]
         self.validation_config = config.get("validation", {})
+        self._http = None
+        self._http_lock = threading.Lock()
+        self._db_metadata = {}
+        self._db_metadata_lock = threading.Lock()
+        
+        # Per-check results of the last run_validation_checks, reused by generate_validation_report
+        self._last_results = {}
+        self._last_direction = None
+        
+        # Shared SSH manager, created on first remote call
+        self._ssh_manager = None
+        self._ssh_lock = threading.Lock()
+        self._remote_slots = threading.BoundedSemaphore(_MAX_REMOTE_CHECKS)
         
         # Default validation settings if not specified
         if not self.validation_config:
@@ -58,6 +207,49 @@ class ValidationManager:
                     }
                 }
             }
+            
+        # Resolve the check settings once rather than walking the nested config on every use
+        checks = self.validation_config.get("checks", {})
+        core_files = checks.get("core_files", {})
+        database = checks.get("database", {})
+        accessibility = checks.get("accessibility", {})
+        self._parallel = self.validation_config.get("parallel", True)
+        self._fail_fast = self.validation_config.get("fail_fast", False)
+        self._cf_enabled = core_files.get("enabled", True)
+        self._cf_verify_checksums = core_files.get("verify_checksums", True)
+        self._cf_cache_checksums = core_files.get("cache_checksums", False)
+        self._cf_critical_files = core_files.get("critical_files", [])
+        self._db_enabled = database.get("enabled", True)
+        self._db_verify_core = database.get("verify_core_tables", True)
+        self._db_additional = database.get("additional_tables", [])
+        self._acc_home = accessibility.get("homepage", True)
+        self._acc_wpadmin = accessibility.get("wp_admin", True)
+
+    def _ssh(self):
+        """
+        Get the SSH manager shared by all remote validation checks.
+
+        Returns:
+            SSHManager: SSH manager instance.
+        """
+        with self._ssh_lock:
+            if self._ssh_manager is None:
+                self._ssh_manager = SSHManager(self.config)
+            return self._ssh_manager
+
+    def _execute_remote(self, cmd):
+        """
+        Run a command on the remote server, waiting for a free slot if too many are running.
+
+        Args:
+            cmd (str): Command to execute.
+
+        Returns:
+            tuple: (success, output)
+        """
+        ssh_manager = self._ssh()
+        with self._remote_slots:
+            return ssh_manager.execute_remote_command(cmd)
 
     def run_validation_checks(self, direction, skip_files=False, skip_db=False):
         """
@@ -94,46 +286,113 @@ class ValidationManager:
             sync_type.append("full")
             
         print(f"Running {sync_type[0]} validation checks on {'remote' if is_remote else 'local'} environment...")
+        self.reset_cache()
+        self._last_direction = direction
         
-        all_checks_passed = True
+        # Each phase is (name, message, check function, arguments); skipped phases only print their message
+        phases = []
         
         # Core files validation - skip if db_only
-        if not skip_files and self.validation_config.get("checks", {}).get("core_files", {}).get("enabled", True):
-            print("Validating core files...")
-            core_files_passed = self.validate_core_files(target_path, is_remote)
-            if not core_files_passed:
-                print("Core files validation failed")
-                all_checks_passed = False
-            else:
-                print("Core files validation passed")
+        if not skip_files and self._cf_enabled:
+            phases.append(("Core files", "Validating core files...", self.validate_core_files, (target_path, is_remote)))
         elif skip_files:
-            print("Skipping core files validation (database-only synchronization)")
+            phases.append((None, "Skipping core files validation (database-only synchronization)", None, ()))
                 
         # Database validation - skip if files_only
-        if not skip_db and self.validation_config.get("checks", {}).get("database", {}).get("enabled", True):
-            print("Validating database...")
-            database_passed = self.validate_database(target_path, is_remote)
-            if not database_passed:
-                print("Database validation failed")
-                all_checks_passed = False
-            else:
-                print("Database validation passed")
+        if not skip_db and self._db_enabled:
+            phases.append(("Database", "Validating database...", self.validate_database, (target_path, is_remote)))
         elif skip_db:
-            print("Skipping database validation (files-only synchronization)")
+            phases.append((None, "Skipping database validation (files-only synchronization)", None, ()))
                 
         # Accessibility validation - always run this
-        if self.validation_config.get("checks", {}).get("accessibility", {}).get("homepage", True) or \
-           self.validation_config.get("checks", {}).get("accessibility", {}).get("wp_admin", True):
-            print("Validating site accessibility...")
-            accessibility_passed = self.validate_accessibility(target_domain)
-            if not accessibility_passed:
-                print("Accessibility validation failed")
+        if self._acc_home or self._acc_wpadmin:
+            phases.append(("Accessibility", "Validating site accessibility...", self.validate_accessibility, (target_domain,)))
+            
+        # The phases are independent and mostly waiting on wp-cli, SSH or HTTP, so run them
+        # at once; each phase's output is held back and printed in order once all are done
+        results = self._run_checks([(func, args) for _, _, func, args in phases if func is not None],
+                                   stop_on_failure=self._fail_fast)
+        
+        # Concurrent phases have all finished by now, so their report goes out in a single
+        # write; phases run one at a time print as they go, so flush ahead of each of them
+        concurrent = self._parallel and len([phase for phase in phases if phase[2] is not None]) > 1
+        lines = []
+        
+        all_checks_passed = True
+        for name, message, func, args in phases:
+            lines.append(f"{message}\n")
+            if func is None:
+                continue
+            if not concurrent:
+                _write_lines(lines)
+            passed, captured = next(results)
+            if passed is None:
+                lines.append(f"{name} validation stopped after an earlier failure\n")
+                continue
+            lines.append(captured)
+            if not passed:
+                lines.append(f"{name} validation failed\n")
+                if self._fail_fast:
+                    lines.append("Stopping validation checks after the first failure (fail_fast)\n")
+                    _write_lines(lines)
+                    return False
                 all_checks_passed = False
             else:
-                print("Accessibility validation passed")
+                lines.append(f"{name} validation passed\n")
                 
+        _write_lines(lines)
         return all_checks_passed
 
+    def _run_checks(self, calls, stop_on_failure=False):
+        """
+        Run independent checks, concurrently unless validation.parallel is turned off.
+
+        Output from concurrent checks is held back and returned with their results so the
+        caller can print it in call order; checks run one at a time print as they go.
+
+        Args:
+            calls (list): (function, args) pairs.
+            stop_on_failure (bool): Stop waiting for concurrent checks once one has failed.
+                Checks that already started can't be interrupted; they still run to
+                completion in the background (and the interpreter waits for them on
+                exit), with their output discarded.
+
+        Yields:
+            tuple: (result, held-back output) for each call, in call order; the result is
+                None for checks abandoned after a failure.
+        """
+        if not self._parallel or len(calls) < 2:
+            for func, args in calls:
+                yield func(*args), ""
+            return
+
+        # Checks nested inside an already-captured check share its router, so their
+        # output still ends up in the enclosing check's buffer
+        output = sys.stdout if isinstance(sys.stdout, _ThreadOutput) else _ThreadOutput(sys.stdout)
+        output.acquire()
+        executor = ThreadPoolExecutor(max_workers=min(len(calls), _MAX_PARALLEL_CHECKS))
+        pending = set()
+        try:
+            futures = [executor.submit(output.capture, func, *args) for func, args in calls]
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if stop_on_failure and not all(future.result()[0] for future in done):
+                    for future in pending:
+                        future.cancel()
+                    break
+            results = [future.result() if future.done() and not future.cancelled() else (None, "") for future in futures]
+        finally:
+            executor.shutdown(wait=not pending)
+            # Checks abandoned after a failure finish in the background; the router stays
+            # in place until the last of them is done, so their output keeps going to
+            # their own (discarded) buffers
+            for future in pending:
+                output.acquire()
+                future.add_done_callback(lambda _: output.release())
+            output.release()
+        yield from results
+
     def validate_core_files(self, target_path, is_remote=False):
         """
         Validate WordPress core files.
@@ -146,20 +405,25 @@ class ValidationManager:
             bool: True if validation passes, False otherwise.
         """
         validation_passed = True
+        checks = []
         
         # Verify WordPress core checksums
-        if self.validation_config.get("checks", {}).get("core_files", {}).get("verify_checksums", True):
-            checksums_passed = self._verify_core_checksums(target_path, is_remote)
-            if not checksums_passed:
-                print("WordPress core checksums verification failed")
-                validation_passed = False
+        if self._cf_verify_checksums:
+            checks.append(("checksums", "WordPress core checksums", self._verify_core_checksums, (target_path, is_remote)))
                 
         # Verify critical files exist
-        critical_files = self.validation_config.get("checks", {}).get("core_files", {}).get("critical_files", [])
+        critical_files = self._cf_critical_files
         if critical_files:
-            files_passed = self._verify_critical_files(target_path, critical_files, is_remote)
-            if not files_passed:
-                print("Critical files verification failed")
+            checks.append(("critical_files", "Critical files", self._verify_critical_files, (target_path, critical_files, is_remote)))
+            
+        # The slow checksum run and the quick file checks don't depend on each other
+        results = self._run_checks([(func, args) for _, _, func, args in checks])
+        for key, label, _, _ in checks:
+            passed, captured = next(results)
+            sys.stdout.write(captured)
+            self._last_results[key] = passed
+            if not passed:
+                print(f"{label} verification failed")
                 validation_passed = False
                 
         return validation_passed
@@ -168,6 +432,12 @@ class ValidationManager:
         """
         Verify WordPress core checksums.
 
+        'wp core verify-checksums' downloads the checksum list and hashes every core file,
+        so with core_files.cache_checksums turned on a passing result is remembered against
+        the core version and the core files' sizes and modification times (the same quick
+        check rsync uses) and reused while those are unchanged. An edit that keeps a file's
+        size and mtime goes unnoticed, which is why the cache is opt-in.
+
         Args:
             path (str): Path to WordPress installation.
             is_remote (bool): Whether the path is on a remote server.
@@ -175,13 +445,122 @@ class ValidationManager:
         Returns:
             bool: True if checksums match, False otherwise.
         """
+        fingerprint = None
+        if self._cf_cache_checksums:
+            fingerprint = self._core_files_fingerprint(path, is_remote)
+            
+        site = f"{self.config['ssh']['host']}:{path}" if is_remote else f"local:{path}"
+        if fingerprint and self._load_checksum_cache().get(site) == fingerprint:
+            print("Core files unchanged since their checksums last passed, skipping verification")
+            return True
+            
+        checksums_passed = self._run_core_checksums(path, is_remote)
+        if checksums_passed and fingerprint:
+            self._save_checksum_cache(site, fingerprint)
+        return checksums_passed
+
+    def _core_files_fingerprint(self, path, is_remote=False):
+        """
+        Summarize the core version and the core files' count, total size and modification times.
+
+        Args:
+            path (str): Path to WordPress installation.
+            is_remote (bool): Whether the path is on a remote server.
+
+        Returns:
+            str: The fingerprint, or None if the files couldn't be listed.
+        """
         try:
             if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
+                cmd = f"cd {shlex.quote(path)} && wp core version --allow-root && {_CORE_FINGERPRINT_SH}"
+                success, output = self._execute_remote(cmd)
+                if not success:
+                    return None
+                version, _, fingerprint = output.strip().partition("\n")
+            else:
+                result = subprocess.run(
+                    [WP_BIN, f"--path={path}", "core", "version", "--allow-root"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    check=False
+                )
+                if result.returncode != 0:
+                    return None
+                version = result.stdout
+                count = size = mtimes = 0
+                stack = [os.path.join(path, "wp-admin"), os.path.join(path, "wp-includes")]
+                with os.scandir(path) as entries:
+                    files = [entry for entry in entries if entry.name.endswith(".php") and entry.is_file(follow_symlinks=False)]
+                while stack:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                files.append(entry)
+                for entry in files:
+                    stat = entry.stat(follow_symlinks=False)
+                    count += 1
+                    size += stat.st_size
+                    mtimes += int(stat.st_mtime)
+                fingerprint = f"{count} {size} {mtimes}"
                 
-                cmd = f'wp --path="{path}" core verify-checksums --allow-root'
-                success, output = ssh_manager.execute_remote_command(cmd)
+            # An empty listing (or a find without -printf) gives nothing worth caching against
+            version = version.strip()
+            fingerprint = fingerprint.strip()
+            if not version or not fingerprint or fingerprint.startswith("0 "):
+                return None
+            return f"{version} {fingerprint}"
+            
+        except OSError:
+            return None
+
+    def _load_checksum_cache(self):
+        """
+        Load the remembered core file fingerprints.
+
+        Returns:
+            dict: Fingerprints by site, empty if there is no readable cache.
+        """
+        try:
+            with open(_CHECKSUM_CACHE_PATH) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_checksum_cache(self, site, fingerprint):
+        """
+        Remember the core file fingerprint of a site whose checksums passed.
+
+        Args:
+            site (str): Host and path identifying the installation.
+            fingerprint (str): Fingerprint from _core_files_fingerprint.
+        """
+        cache = self._load_checksum_cache()
+        cache[site] = fingerprint
+        try:
+            os.makedirs(os.path.dirname(_CHECKSUM_CACHE_PATH), exist_ok=True)
+            with open(_CHECKSUM_CACHE_PATH, "w") as cache_file:
+                json.dump(cache, cache_file, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not save the checksum cache: {e}")
+
+    def _run_core_checksums(self, path, is_remote=False):
+        """
+        Run 'wp core verify-checksums'.
+
+        Args:
+            path (str): Path to WordPress installation.
+            is_remote (bool): Whether the path is on a remote server.
+
+        Returns:
+            bool: True if checksums match, False otherwise.
+        """
+        try:
+            if is_remote:
+                cmd = f"wp {shlex.quote(f'--path={path}')} core verify-checksums --allow-root"
+                success, output = self._execute_remote(cmd)
                 
                 if not success:
                     print(f"Failed to verify core checksums on remote server: {output}")
@@ -189,14 +568,13 @@ class ValidationManager:
                     
                 return "success" in output.lower() or "all checksums match" in output.lower()
             else:
-                cmd = f'wp --path="{path}" core verify-checksums --allow-root'
+                cmd = [WP_BIN, f"--path={path}", "core", "verify-checksums", "--allow-root"]
                 result = subprocess.run(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
@@ -223,23 +601,45 @@ class ValidationManager:
         """
         all_files_exist = True
         
-        for file in critical_files:
-            file_path = os.path.join(path, file)
+        if is_remote:
+            # Test every file in one round trip; each found file is echoed back
+            file_paths = {os.path.join(path, file): file for file in critical_files}
+            quoted = " ".join(shlex.quote(file_path) for file_path in file_paths)
+            cmd = f'for f in {quoted}; do [ -f "$f" ] && echo "exists:$f"; done; true'
+            success, output = self._execute_remote(cmd)
             
-            if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                
-                cmd = f'test -f "{file_path}" && echo "exists" || echo "not found"'
-                success, output = ssh_manager.execute_remote_command(cmd)
-                
-                if not success or "not found" in output:
+            found = set()
+            if success:
+                found = {line[len("exists:"):] for line in output.splitlines() if line.startswith("exists:")}
+            for file_path, file in file_paths.items():
+                if file_path not in found:
                     print(f"Critical file not found on remote server: {file}")
                     all_files_exist = False
-            else:
-                if not os.path.isfile(file_path):
-                    print(f"Critical file not found on local server: {file}")
-                    all_files_exist = False
+                    
+            return all_files_exist
+        
+        # List each directory holding several critical files once instead of
+        # stat'ing the files one by one
+        by_directory = {}
+        for file in critical_files:
+            by_directory.setdefault(os.path.dirname(os.path.join(path, file)), []).append(file)
+        present = {}
+        for directory, files in by_directory.items():
+            if len(files) > 1:
+                try:
+                    with os.scandir(directory) as entries:
+                        present[directory] = {entry.name for entry in entries if entry.is_file()}
+                except OSError:
+                    present[directory] = set()
+        
+        for file in critical_files:
+            file_path = os.path.join(path, file)
+            directory, name = os.path.split(file_path)
+            
+            exists = name in present[directory] if directory in present else os.path.isfile(file_path)
+            if not exists:
+                print(f"Critical file not found on local server: {file}")
+                all_files_exist = False
                     
         return all_files_exist
 
@@ -255,20 +655,25 @@ class ValidationManager:
             bool: True if validation passes, False otherwise.
         """
         validation_passed = True
+        checks = []
         
         # Verify core tables
-        if self.validation_config.get("checks", {}).get("database", {}).get("verify_core_tables", True):
-            tables_passed = self._verify_core_tables(target_path, is_remote)
-            if not tables_passed:
-                print("WordPress core tables verification failed")
-                validation_passed = False
+        if self._db_verify_core:
+            checks.append(("core_tables", "WordPress core tables", self._verify_core_tables, (target_path, is_remote)))
                 
         # Verify additional tables
-        additional_tables = self.validation_config.get("checks", {}).get("database", {}).get("additional_tables", [])
+        additional_tables = self._db_additional
         if additional_tables:
-            additional_passed = self._verify_additional_tables(target_path, additional_tables, is_remote)
-            if not additional_passed:
-                print("Additional tables verification failed")
+            checks.append(("additional_tables", "Additional tables", self._verify_additional_tables, (target_path, additional_tables, is_remote)))
+            
+        # Both share one cached database lookup, so whichever starts second just waits for it
+        results = self._run_checks([(func, args) for _, _, func, args in checks])
+        for key, label, _, _ in checks:
+            passed, captured = next(results)
+            sys.stdout.write(captured)
+            self._last_results[key] = passed
+            if not passed:
+                print(f"{label} verification failed")
                 validation_passed = False
                 
         return validation_passed
@@ -285,64 +690,19 @@ class ValidationManager:
             bool: True if all core tables exist, False otherwise.
         """
         try:
-            # Core WordPress tables to check
-            core_tables = [
-                "wp_commentmeta",
-                "wp_comments",
-                "wp_links",
-                "wp_options",
-                "wp_postmeta",
-                "wp_posts",
-                "wp_terms",
-                "wp_term_relationships",
-                "wp_term_taxonomy",
-                "wp_usermeta",
-                "wp_users"
-            ]
-            
-            # Get table prefix
-            prefix = self._get_table_prefix(path, is_remote)
+            # Get table prefix and existing tables
+            prefix, existing_tables = self._fetch_db_metadata(path, is_remote)
             if not prefix:
                 print("Failed to get table prefix")
                 return False
                 
-            # Replace 'wp_' with actual prefix
-            core_tables = [table.replace("wp_", prefix) for table in core_tables]
+            # Core tables under the actual prefix
+            core_tables = frozenset(prefix + suffix for suffix in _CORE_TABLE_SUFFIXES)
             
-            # Check if tables exist
-            if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                
-                cmd = f'wp --path="{path}" db tables --allow-root'
-                success, output = ssh_manager.execute_remote_command(cmd)
-                
-                if not success:
-                    print(f"Failed to get database tables on remote server: {output}")
-                    return False
-                    
-                existing_tables = output.strip().split("\n")
-            else:
-                cmd = f'wp --path="{path}" db tables --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to get database tables on local server: {result.stderr}")
-                    return False
-                    
-                existing_tables = result.stdout.strip().split("\n")
-                
             # Check if all core tables exist
-            missing_tables = [table for table in core_tables if table not in existing_tables]
+            missing_tables = core_tables - existing_tables
             if missing_tables:
-                print(f"Missing core tables: {', '.join(missing_tables)}")
+                print(f"Missing core tables: {', '.join(sorted(missing_tables))}")
                 return False
                 
             return True
@@ -351,50 +711,82 @@ class ValidationManager:
             print(f"Error verifying core tables: {e}")
             return False
 
-    def _get_table_prefix(self, path, is_remote=False):
+    def _fetch_db_metadata(self, path, is_remote=False):
         """
-        Get WordPress database table prefix.
+        Get the table prefix and existing tables of a WordPress database.
+
+        Both are looked up once per installation and shared by every table check
+        until reset_cache() is called.
 
         Args:
             path (str): Path to WordPress installation.
             is_remote (bool): Whether the path is on a remote server.
 
         Returns:
-            str: Table prefix, or None if retrieval failed.
+            tuple: (table prefix, frozenset of table names), or (None, None) if the lookup failed.
+        """
+        key = (path, is_remote)
+        with self._db_metadata_lock:
+            if key not in self._db_metadata:
+                self._db_metadata[key] = self._probe_database(path, is_remote)
+            return self._db_metadata[key]
+
+    def reset_cache(self):
+        """
+        Forget the database metadata and check results of earlier validation runs.
+
+        Called at the start of every run_validation_checks, since the site may have
+        changed since the last one; call it after changing the site between a run and
+        generate_validation_report.
+        """
+        with self._db_metadata_lock:
+            self._db_metadata.clear()
+        self._last_results = {}
+        self._last_direction = None
+
+    def _probe_database(self, path, is_remote=False):
+        """
+        Get the table prefix and existing tables of a WordPress database with one wp-cli call.
+
+        Args:
+            path (str): Path to WordPress installation.
+            is_remote (bool): Whether the path is on a remote server.
+
+        Returns:
+            tuple: (table prefix, frozenset of table names), or (None, None) if the probe failed.
         """
         try:
             if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                
-                cmd = f'wp --path="{path}" config get table_prefix --allow-root'
-                success, output = ssh_manager.execute_remote_command(cmd)
+                cmd = f"wp {shlex.quote(f'--path={path}')} eval {shlex.quote(_DB_PROBE_PHP)} --allow-root"
+                success, output = self._execute_remote(cmd)
                 
                 if not success:
-                    print(f"Failed to get table prefix on remote server: {output}")
-                    return None
-                    
-                return output.strip()
+                    print(f"Failed to query the database on remote server: {output}")
+                    return None, None
             else:
-                cmd = f'wp --path="{path}" config get table_prefix --allow-root'
+                cmd = [WP_BIN, f"--path={path}", "eval", _DB_PROBE_PHP, "--allow-root"]
                 result = subprocess.run(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True,
-                    check=False,
-                    shell=True
+                    check=False
                 )
                 
                 if result.returncode != 0:
-                    print(f"Failed to get table prefix on local server: {result.stderr}")
-                    return None
+                    print(f"Failed to query the database on local server: {result.stderr}")
+                    return None, None
                     
-                return result.stdout.strip()
+                output = result.stdout
+                
+            # PHP notices may come first; the JSON is always the last line
+            lines = output.strip().splitlines()
+            probe = json.loads(lines[-1]) if lines else {}
+            return probe.get("prefix"), frozenset(probe.get("tables", []))
                 
         except Exception as e:
-            print(f"Error getting table prefix: {e}")
-            return None
+            print(f"Error querying the database: {e}")
+            return None, None
 
     def _verify_additional_tables(self, path, additional_tables, is_remote=False):
         """
@@ -409,49 +801,19 @@ class ValidationManager:
             bool: True if all additional tables exist, False otherwise.
         """
         try:
-            # Get table prefix
-            prefix = self._get_table_prefix(path, is_remote)
+            # Get table prefix and existing tables
+            prefix, existing_tables = self._fetch_db_metadata(path, is_remote)
             if not prefix:
                 print("Failed to get table prefix")
                 return False
                 
             # Replace 'wp_' with actual prefix if needed
-            tables_to_check = [table.replace("wp_", prefix) if table.startswith("wp_") else table for table in additional_tables]
+            tables_to_check = frozenset(table.replace("wp_", prefix) if table.startswith("wp_") else table for table in additional_tables)
             
-            # Check if tables exist
-            if is_remote:
-                from resources.ssh_manager import SSHManager
-                ssh_manager = SSHManager(self.config)
-                
-                cmd = f'wp --path="{path}" db tables --allow-root'
-                success, output = ssh_manager.execute_remote_command(cmd)
-                
-                if not success:
-                    print(f"Failed to get database tables on remote server: {output}")
-                    return False
-                    
-                existing_tables = output.strip().split("\n")
-            else:
-                cmd = f'wp --path="{path}" db tables --allow-root'
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False,
-                    shell=True
-                )
-                
-                if result.returncode != 0:
-                    print(f"Failed to get database tables on local server: {result.stderr}")
-                    return False
-                    
-                existing_tables = result.stdout.strip().split("\n")
-                
             # Check if all additional tables exist
-            missing_tables = [table for table in tables_to_check if table not in existing_tables]
+            missing_tables = tables_to_check - existing_tables
             if missing_tables:
-                print(f"Missing additional tables: {', '.join(missing_tables)}")
+                print(f"Missing additional tables: {', '.join(sorted(missing_tables))}")
                 return False
                 
             return True
@@ -471,23 +833,64 @@ class ValidationManager:
             bool: True if validation passes, False otherwise.
         """
         validation_passed = True
+        checks = []
         
         # Check homepage
-        if self.validation_config.get("checks", {}).get("accessibility", {}).get("homepage", True):
-            homepage_passed = self._check_url_accessibility(target_domain)
-            if not homepage_passed:
-                print(f"Homepage accessibility check failed: {target_domain}")
-                validation_passed = False
+        if self._acc_home:
+            checks.append(("homepage", "Homepage", target_domain))
                 
         # Check wp-admin
-        if self.validation_config.get("checks", {}).get("accessibility", {}).get("wp_admin", True):
-            wp_admin_passed = self._check_url_accessibility(f"{target_domain}/wp-admin/")
-            if not wp_admin_passed:
-                print(f"WP Admin accessibility check failed: {target_domain}/wp-admin/")
+        if self._acc_wpadmin:
+            checks.append(("wp_admin", "WP Admin", f"{target_domain}/wp-admin/"))
+            
+        results = self._run_checks([(self._check_url_accessibility, (url,)) for _, _, url in checks])
+        for key, label, url in checks:
+            passed, captured = next(results)
+            sys.stdout.write(captured)
+            self._last_results[key] = passed
+            if not passed:
+                print(f"{label} accessibility check failed: {url}")
                 validation_passed = False
                 
         return validation_passed
 
+    def _http_session(self):
+        """
+        Get the HTTP session shared by the accessibility checks, creating it on first use.
+
+        Reusing one session keeps the connection to the site alive between checks.
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        with self._http_lock:
+            if self._http is None:
+                requests = _requests()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+                self._http = requests.Session()
+                self._http.mount("http://", adapter)
+                self._http.mount("https://", adapter)
+            return self._http
+
+    def _is_expected_response(self, response, is_wp_admin):
+        """
+        Check whether a response is the one a working site gives.
+
+        Args:
+            response (requests.Response): Response to a request made without following redirects.
+            is_wp_admin (bool): Whether the request was for wp-admin.
+
+        Returns:
+            bool: True for a 200, or for wp-admin a 302 to the login page.
+        """
+        if not is_wp_admin:
+            return response.status_code == 200
+        location = response.headers.get('location', '')
+        return (
+            response.status_code == 302
+            and 'wp-login.php' in location and 'redirect_to' in location and 'wp-admin' in location
+        )
+
     def _check_url_accessibility(self, url):
         """
         Check if a URL is accessible.
@@ -498,13 +901,19 @@ class ValidationManager:
         Returns:
             bool: True if URL is accessible, False otherwise.
         """
+        requests = _requests()
         try:
             # Disable SSL certificate verification for accessibility checks
             # For wp-admin URLs, we need to check the redirect location
             is_wp_admin = '/wp-admin/' in url
             
-            # Don't follow redirects so we can check the initial response
-            response = requests.get(url, timeout=10, allow_redirects=False, verify=False)
+            # Don't follow redirects so we can check the initial response. Only the status
+            # and Location header matter, so try HEAD first; many hosts, WAFs and security
+            # plugins answer HEAD differently, so anything unexpected is retried with GET
+            session = self._http_session()
+            response = session.head(url, timeout=10, allow_redirects=False, verify=False)
+            if not self._is_expected_response(response, is_wp_admin):
+                response = session.get(url, timeout=10, allow_redirects=False, verify=False)
             
             # For homepage or non-admin URLs, 200 is a success
             if not is_wp_admin and response.status_code == 200:
@@ -529,18 +938,25 @@ class ValidationManager:
             print(f"Error checking URL accessibility: {e}")
             return False
 
-    def generate_validation_report(self, direction, skip_files=False, skip_db=False):
+    def generate_validation_report(self, direction, skip_files=False, skip_db=False, results=None):
         """
         Generate a validation report.
 
+        Checks already run by run_validation_checks for the same direction aren't run again.
+
         Args:
             direction (str): Direction of synchronization ('push' or 'pull').
             skip_files (bool): Skip file-related validation checks.
             skip_db (bool): Skip database-related validation checks.
+            results (dict): Known per-check results; defaults to those of the last run_validation_checks.
 
         Returns:
             str: Validation report.
         """
+        if results is None:
+            results = self._last_results if self._last_direction == direction else {}
+        results = dict(results)
+        
         # Determine target environment
         if direction == "push":
             target_path = self.live_path
@@ -569,18 +985,18 @@ class ValidationManager:
         report.append("")
         
         # Core files validation - skip if db_only
-        if not skip_files and self.validation_config.get("checks", {}).get("core_files", {}).get("enabled", True):
+        if not skip_files and self._cf_enabled:
             report.append("--- Core Files Validation ---")
             
             # Verify WordPress core checksums
-            if self.validation_config.get("checks", {}).get("core_files", {}).get("verify_checksums", True):
-                checksums_passed = self._verify_core_checksums(target_path, is_remote)
+            if self._cf_verify_checksums:
+                checksums_passed = self._check_result(results, "checksums", self._verify_core_checksums, target_path, is_remote)
                 report.append(f"Core Checksums: {'PASS' if checksums_passed else 'FAIL'}")
                 
             # Verify critical files exist
-            critical_files = self.validation_config.get("checks", {}).get("core_files", {}).get("critical_files", [])
+            critical_files = self._cf_critical_files
             if critical_files:
-                files_passed = self._verify_critical_files(target_path, critical_files, is_remote)
+                files_passed = self._check_result(results, "critical_files", self._verify_critical_files, target_path, critical_files, is_remote)
                 report.append(f"Critical Files: {'PASS' if files_passed else 'FAIL'}")
                 
             report.append("")
@@ -590,18 +1006,18 @@ class ValidationManager:
             report.append("")
             
         # Database validation - skip if files_only
-        if not skip_db and self.validation_config.get("checks", {}).get("database", {}).get("enabled", True):
+        if not skip_db and self._db_enabled:
             report.append("--- Database Validation ---")
             
             # Verify core tables
-            if self.validation_config.get("checks", {}).get("database", {}).get("verify_core_tables", True):
-                tables_passed = self._verify_core_tables(target_path, is_remote)
+            if self._db_verify_core:
+                tables_passed = self._check_result(results, "core_tables", self._verify_core_tables, target_path, is_remote)
                 report.append(f"Core Tables: {'PASS' if tables_passed else 'FAIL'}")
                 
             # Verify additional tables
-            additional_tables = self.validation_config.get("checks", {}).get("database", {}).get("additional_tables", [])
+            additional_tables = self._db_additional
             if additional_tables:
-                additional_passed = self._verify_additional_tables(target_path, additional_tables, is_remote)
+                additional_passed = self._check_result(results, "additional_tables", self._verify_additional_tables, target_path, additional_tables, is_remote)
                 report.append(f"Additional Tables: {'PASS' if additional_passed else 'FAIL'}")
                 
             report.append("")
@@ -611,20 +1027,36 @@ class ValidationManager:
             report.append("")
             
         # Accessibility validation
-        if self.validation_config.get("checks", {}).get("accessibility", {}).get("homepage", True) or \
-           self.validation_config.get("checks", {}).get("accessibility", {}).get("wp_admin", True):
+        if self._acc_home or self._acc_wpadmin:
             report.append("--- Accessibility Validation ---")
             
             # Check homepage
-            if self.validation_config.get("checks", {}).get("accessibility", {}).get("homepage", True):
-                homepage_passed = self._check_url_accessibility(target_domain)
+            if self._acc_home:
+                homepage_passed = self._check_result(results, "homepage", self._check_url_accessibility, target_domain)
                 report.append(f"Homepage: {'PASS' if homepage_passed else 'FAIL'}")
                 
             # Check wp-admin
-            if self.validation_config.get("checks", {}).get("accessibility", {}).get("wp_admin", True):
-                wp_admin_passed = self._check_url_accessibility(f"{target_domain}/wp-admin/")
+            if self._acc_wpadmin:
+                wp_admin_passed = self._check_result(results, "wp_admin", self._check_url_accessibility, f"{target_domain}/wp-admin/")
                 report.append(f"WP Admin: {'PASS' if wp_admin_passed else 'FAIL'}")
                 
             report.append("")
             
         return "\n".join(report)
+
+    def _check_result(self, results, key, func, *args):
+        """
+        Get a check's result from earlier results, running the check if it isn't there.
+
+        Args:
+            results (dict): Known per-check results.
+            key (str): Name of the check in results.
+            func (callable): Check to run if its result isn't known.
+            *args: Arguments for the check.
+
+        Returns:
+            bool: Result of the check.
+        """
+        if key not in results:
+            results[key] = func(*args)
+        return results[key]
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+WP-CLI location for WordPress Sync.
+
+This module resolves the local WP-CLI executable once, so every manager that runs
+wp commands locally shares the same path instead of searching PATH on every call.
+"""
+
+import shutil
+
+# Resolved once at import; falls back to plain "wp" so a missing binary fails when used
+WP_BIN = shutil.which("wp") or "wp"
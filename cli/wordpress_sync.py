@@ -8,7 +8,10 @@ maintenance mode, and validation checks.
 """
 
 import argparse
+import logging
 import os
+import shlex
+import shutil
 import sys
 import time
 from pathlib import Path
@@ -32,6 +35,33 @@ except ImportError as e:
     sys.exit(1)
 
 
+def _local_dir_has_files(path):
+    """
+    Check whether a local directory tree contains any file, stopping at the first one.
+
+    Like os.walk, anything that isn't a directory counts as a file, symlinked
+    directories aren't followed and unreadable directories are skipped.
+
+    Args:
+        path (str): Directory to search.
+
+    Returns:
+        bool: True if a file was found, False otherwise.
+    """
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        return True
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
+
+
 class WordPressSync:
     """Main class for WordPress synchronization tool."""
 
@@ -51,6 +81,11 @@ class WordPressSync:
         self.dry_run = None
         self.non_interactive = False
         
+        # Resolved backup roots (by direction) and DB temp dirs (by side); the config
+        # they come from doesn't change once loaded
+        self._backup_roots = {}
+        self._db_temp_dirs = {}
+        
     def _is_new_backup_format(self):
         """Check if the config uses the new unified backup directory format (dict with local/remote)."""
         if "backup" not in self.config:
@@ -74,6 +109,9 @@ class WordPressSync:
             self.config["backup"] = {}
             
         dir_val = direction or self.direction
+        if dir_val in self._backup_roots:
+            return self._backup_roots[dir_val]
+            
         raw_dir = self.config["backup"].get("directory", "../.backup")
         
         if isinstance(raw_dir, dict):
@@ -95,6 +133,7 @@ class WordPressSync:
             else:
                 backup_dir = os.path.join(base_path.rstrip('/'), backup_dir)
             
+        self._backup_roots[dir_val] = backup_dir
         return backup_dir
 
     def _get_latest_backup_path(self):
@@ -137,16 +176,22 @@ class WordPressSync:
         Returns:
             str: Resolved absolute path to the local DB temp directory.
         """
+        if "local" in self._db_temp_dirs:
+            return self._db_temp_dirs["local"]
+
         raw = self.config["paths"]["db_temp"]
         db_temp = raw.get("local", "/tmp") if isinstance(raw, dict) else raw
         base_path = self.config["paths"]["local"]
 
-        if os.path.isabs(db_temp):
-            return db_temp
-        if db_temp.startswith('../'):
-            parent_dir = os.path.dirname(base_path.rstrip('/'))
-            return os.path.join(parent_dir, db_temp[3:])
-        return os.path.join(base_path.rstrip('/'), db_temp)
+        if not os.path.isabs(db_temp):
+            if db_temp.startswith('../'):
+                parent_dir = os.path.dirname(base_path.rstrip('/'))
+                db_temp = os.path.join(parent_dir, db_temp[3:])
+            else:
+                db_temp = os.path.join(base_path.rstrip('/'), db_temp)
+
+        self._db_temp_dirs["local"] = db_temp
+        return db_temp
 
     def _resolve_remote_db_temp(self):
         """
@@ -158,21 +203,47 @@ class WordPressSync:
         Returns:
             str: Resolved absolute path to the remote DB temp directory.
         """
+        if "remote" in self._db_temp_dirs:
+            return self._db_temp_dirs["remote"]
+
         raw = self.config["paths"]["db_temp"]
         db_temp = raw.get("remote", "/tmp") if isinstance(raw, dict) else raw
         base_path = self.config["paths"]["live"]
 
-        if os.path.isabs(db_temp):
-            return db_temp
-        if db_temp.startswith('../'):
-            parent_dir = os.path.dirname(base_path.rstrip('/'))
-            return os.path.join(parent_dir, db_temp[3:])
-        return os.path.join(base_path.rstrip('/'), db_temp)
+        if not os.path.isabs(db_temp):
+            if db_temp.startswith('../'):
+                parent_dir = os.path.dirname(base_path.rstrip('/'))
+                db_temp = os.path.join(parent_dir, db_temp[3:])
+            else:
+                db_temp = os.path.join(base_path.rstrip('/'), db_temp)
+
+        self._db_temp_dirs["remote"] = db_temp
+        return db_temp
         
-    def _list_latest_backup_contents(self):
+    def _list_remote_backup_files(self, backup_dir):
+        """
+        Ensure the remote backup directory exists and list the files in it, in one SSH call.
+
+        Args:
+            backup_dir (str): Backup directory on the remote server.
+
+        Returns:
+            tuple: (success, sorted list of file paths, or error output on failure)
+        """
+        quoted_dir = shlex.quote(backup_dir)
+        cmd = f"mkdir -p {quoted_dir} && find {quoted_dir} -type f | sort"
+        success, output = self.ssh_manager.execute_remote_command(cmd)
+        if not success:
+            return False, output
+        return True, [line for line in output.strip().split('\n') if line]
+
+    def _list_latest_backup_contents(self, files=None):
         """
         List the contents of the latest backup directory.
         
+        Args:
+            files (list): Remote backup files the caller has already listed; fetched if None.
+        
         Returns:
             bool: True if successful, False otherwise.
         """
@@ -181,32 +252,28 @@ class WordPressSync:
         try:
             # Check if the backup directory is on the remote server
             if self.direction == "push" and not self.dry_run:
-                # Check if directory exists on remote server
-                check_dir_cmd = f"test -d {backup_dir} && echo 'exists' || echo 'not exists'"
-                success, dir_output = self.ssh_manager.execute_remote_command(check_dir_cmd)
-                
-                if not success:
-                    print(f"Failed to check backup directory: {dir_output}")
-                    return False
-                
-                if dir_output.strip() != "exists":
-                    print("Backup directory does not exist on remote server.")
-                    return False
-                
-                # List files on remote server
-                cmd = f"find {backup_dir} -type f | sort"
-                success, output = self.ssh_manager.execute_remote_command(cmd)
-                
-                if not success:
-                    print(f"Failed to list backup contents: {output}")
-                    return False
+                if files is None:
+                    # Check the directory and list its files in a single remote call
+                    quoted_dir = shlex.quote(backup_dir)
+                    cmd = f"if [ -d {quoted_dir} ]; then echo exists; find {quoted_dir} -type f | sort; fi"
+                    success, output = self.ssh_manager.execute_remote_command(cmd)
                     
-                if not output.strip():
+                    if not success:
+                        print(f"Failed to list backup contents: {output}")
+                        return False
+                        
+                    lines = output.strip().split('\n')
+                    if lines[0].strip() != "exists":
+                        print("Backup directory does not exist on remote server.")
+                        return False
+                    files = [line for line in lines[1:] if line]
+                    
+                if not files:
                     print("No files found in backup directory.")
                     return True
                     
                 print("Files in backup directory:")
-                for line in output.strip().split('\n'):
+                for line in files:
                     print(f"  {line}")
             else:
                 # List files on local system
@@ -244,25 +311,20 @@ class WordPressSync:
             return True  # Skip backup handling if --no-backup flag is used
             
         backup_dir = self._get_latest_backup_path()
+        remote_files = None
         
         try:
             # Check if the backup directory exists and has contents
             if self.direction == "push" and not self.dry_run:
                 # Check on remote server
-                # First ensure the directory exists
-                mkdir_cmd = f"mkdir -p {backup_dir}"
-                self.ssh_manager.execute_remote_command(mkdir_cmd)
-                
-                # Then check if it has any files
-                check_cmd = f"find {backup_dir} -type f | wc -l || echo 0"
-                success, output = self.ssh_manager.execute_remote_command(check_cmd)
+                # Ensure the directory exists and list its files in one call
+                success, remote_files = self._list_remote_backup_files(backup_dir)
                 
                 if not success:
-                    print(f"Failed to check backup directory: {output}")
+                    print(f"Failed to check backup directory: {remote_files}")
                     return False
                     
-                file_count = int(output.strip())
-                if file_count == 0:
+                if not remote_files:
                     return True
             else:
                 # Check on local system
@@ -270,17 +332,13 @@ class WordPressSync:
                     os.makedirs(backup_dir, exist_ok=True)
                     return True
                     
-                # Count files in backup directory
-                file_count = 0
-                for root, _, filenames in os.walk(backup_dir):
-                    file_count += len(filenames)
-                    
-                if file_count == 0:
+                # Stop looking as soon as the backup directory turns out to hold a file
+                if not _local_dir_has_files(backup_dir):
                     return True
                     
             # If we get here, the backup directory exists and has files
             print("\nExisting files found in latest backup directory:")
-            self._list_latest_backup_contents()
+            self._list_latest_backup_contents(remote_files)
             
             # In non-interactive mode, default to keeping existing backup files (safe default)
             if self.non_interactive:
@@ -301,9 +359,7 @@ class WordPressSync:
                 
                 if self.direction == "push" and not self.dry_run:
                     # Archive on remote server - ensure archives dir exists, then move
-                    mkdir_cmd = f"mkdir -p {archives_dir}"
-                    self.ssh_manager.execute_remote_command(mkdir_cmd)
-                    mv_cmd = f"mv {backup_dir} {archive_path}"
+                    mv_cmd = f"mkdir -p {shlex.quote(archives_dir)} && mv {shlex.quote(backup_dir)} {shlex.quote(archive_path)}"
                     success, output = self.ssh_manager.execute_remote_command(mv_cmd)
                     
                     if not success:
@@ -312,7 +368,6 @@ class WordPressSync:
                 else:
                     # Archive on local system - ensure archives dir exists, then move
                     os.makedirs(archives_dir, exist_ok=True)
-                    import shutil
                     shutil.move(backup_dir, archive_path)
                     
                 print(f"Archived existing backup to: {archive_path}")
@@ -320,20 +375,15 @@ class WordPressSync:
             elif response in ["no", "n"]:
                 # Remove existing backup
                 if self.direction == "push" and not self.dry_run:
-                    # Remove entire backup directory on remote server
-                    rm_cmd = f"rm -rf {backup_dir} || true"
+                    # Remove entire backup directory on remote server and recreate it empty
+                    rm_cmd = f"rm -rf {shlex.quote(backup_dir)}; mkdir -p {shlex.quote(backup_dir)}"
                     success, output = self.ssh_manager.execute_remote_command(rm_cmd)
                     
                     if not success:
                         print(f"Failed to remove backup directory: {output}")
                         return False
-                        
-                    # Recreate the empty directory
-                    mkdir_cmd = f"mkdir -p {backup_dir}"
-                    self.ssh_manager.execute_remote_command(mkdir_cmd)
                 else:
                     # Remove entire backup directory on local system
-                    import shutil
                     shutil.rmtree(backup_dir, ignore_errors=True)
                     os.makedirs(backup_dir, exist_ok=True)
                             
@@ -355,24 +405,19 @@ class WordPressSync:
             return True  # Skip backup handling if --no-backup flag is used
             
         backup_dir = self._get_latest_backup_path()
+        remote_files = None
         
         try:
             # Check if the backup directory exists and has contents
             if self.direction == "push" and not self.dry_run:
-                # First ensure the directory exists
-                mkdir_cmd = f"mkdir -p {backup_dir}"
-                self.ssh_manager.execute_remote_command(mkdir_cmd)
-                
-                # Then check if it has any files
-                check_cmd = f"find {backup_dir} -type f | wc -l || echo 0"
-                success, output = self.ssh_manager.execute_remote_command(check_cmd)
+                # Ensure the directory exists and list its files in one call
+                success, remote_files = self._list_remote_backup_files(backup_dir)
                 
                 if not success:
-                    print(f"Failed to check backup directory: {output}")
+                    print(f"Failed to check backup directory: {remote_files}")
                     return False
                     
-                file_count = int(output.strip())
-                if file_count == 0:
+                if not remote_files:
                     print("No files were backed up during sync.")
                     return True
             else:
@@ -381,18 +426,14 @@ class WordPressSync:
                     print("No files were backed up during sync.")
                     return True
                     
-                # Count files in backup directory
-                file_count = 0
-                for root, _, filenames in os.walk(backup_dir):
-                    file_count += len(filenames)
-                    
-                if file_count == 0:
+                # Stop looking as soon as the backup directory turns out to hold a file
+                if not _local_dir_has_files(backup_dir):
                     print("No files were backed up during sync.")
                     return True
                     
             # If we get here, the backup directory exists and has files
             print("\nThe following files were backed up during sync:")
-            self._list_latest_backup_contents()
+            self._list_latest_backup_contents(remote_files)
             
             # In non-interactive mode, default to keeping backups (safe default)
             if self.non_interactive:
@@ -408,7 +449,7 @@ class WordPressSync:
             if response in ["yes", "y"]:
                 if self.direction == "push" and not self.dry_run:
                     # Remove on remote server - remove entire backup directory
-                    rm_cmd = f"rm -rf {backup_dir} || true"
+                    rm_cmd = f"rm -rf {shlex.quote(backup_dir)} || true"
                     success, output = self.ssh_manager.execute_remote_command(rm_cmd)
                     
                     if not success:
@@ -416,7 +457,6 @@ class WordPressSync:
                         return False
                 else:
                     # Remove on local system - remove entire backup directory
-                    import shutil
                     shutil.rmtree(backup_dir, ignore_errors=True)
                             
                 print("Backed up files have been deleted")
@@ -429,9 +469,7 @@ class WordPressSync:
                 
                 if self.direction == "push" and not self.dry_run:
                     # Archive on remote server - ensure archives dir exists, then move
-                    mkdir_cmd = f"mkdir -p {archives_dir}"
-                    self.ssh_manager.execute_remote_command(mkdir_cmd)
-                    mv_cmd = f"mv {backup_dir} {archive_path}"
+                    mv_cmd = f"mkdir -p {shlex.quote(archives_dir)} && mv {shlex.quote(backup_dir)} {shlex.quote(archive_path)}"
                     success, output = self.ssh_manager.execute_remote_command(mv_cmd)
                     
                     if not success:
@@ -440,7 +478,6 @@ class WordPressSync:
                 else:
                     # Archive on local system - ensure archives dir exists, then move
                     os.makedirs(archives_dir, exist_ok=True)
-                    import shutil
                     shutil.move(backup_dir, archive_path)
                     
                 print(f"Backed up files have been archived to: {archive_path}")
@@ -732,77 +769,70 @@ class WordPressSync:
                     "Local User"
                 )
                 
-                # Ensure remote temp directory exists if needed
-                if self.direction == "push" or self.direction == "pull":
-                    remote_db_temp = self._resolve_remote_db_temp()
-                    
-                    mkdir_remote_cmd = f'mkdir -p {remote_db_temp}'
-                    self.command_collector.add_command(
-                        mkdir_remote_cmd,
-                        "Create remote temporary directory for database files",
-                        "remote",
-                        f"{self.config['ssh']['user']}"
-                    )
-                
                 # Pre-sync cleanup
                 if "rsync" in self.config and "cleanup_files" in self.config["rsync"] and self.config["rsync"]["cleanup_files"]:
                     self.command_collector.set_section("Pre-sync Cleanup")
                     
+                    cleanup_files = self.config["rsync"]["cleanup_files"]
+                    name_expr = "\\( " + " -o ".join(f"-name {shlex.quote(pattern)}" for pattern in cleanup_files) + " \\)"
                     if self.direction == "push":
                         # Cleanup on remote (destination)
-                        for file_pattern in self.config["rsync"]["cleanup_files"]:
-                            cleanup_cmd = f'find {self.config["paths"]["live"]} -name \'{file_pattern}\' -type f -delete'
-                            self.command_collector.add_command(
-                                cleanup_cmd,
-                                f"Clean up {file_pattern} files on remote server before sync",
-                                "remote",
-                                f"{self.config['ssh']['user']}"
-                            )
+                        cleanup_cmd = f'find {shlex.quote(self.config["paths"]["live"])} {name_expr} -type f -delete'
+                        self.command_collector.add_command(
+                            cleanup_cmd,
+                            f"Clean up {', '.join(cleanup_files)} files on remote server before sync",
+                            "remote",
+                            f"{self.config['ssh']['user']}"
+                        )
                     else:  # pull
                         # Cleanup on local (destination)
-                        for file_pattern in self.config["rsync"]["cleanup_files"]:
-                            cleanup_cmd = f'find {self.config["paths"]["local"]} -name \'{file_pattern}\' -type f -delete'
-                            self.command_collector.add_command(
-                                cleanup_cmd,
-                                f"Clean up {file_pattern} files on local system before sync",
-                                "local",
-                                "Local User"
-                            )
+                        cleanup_cmd = f'find {shlex.quote(self.config["paths"]["local"])} {name_expr} -type f -delete'
+                        self.command_collector.add_command(
+                            cleanup_cmd,
+                            f"Clean up {', '.join(cleanup_files)} files on local system before sync",
+                            "local",
+                            "Local User"
+                        )
                 
                 # Maintenance mode commands
                 self.command_collector.set_section("Maintenance Mode")
-                local_maint_activate = f'wp --path="{self.config["paths"]["local"]}" maintenance-mode activate --allow-root'
-                self.command_collector.add_command(
-                    local_maint_activate,
-                    "Activate maintenance mode on local WordPress",
-                    "local",
-                    "Local User (root)"
-                )
+                maint_local, maint_remote = self.maintenance_manager.get_maintenance_environments(self.direction)
+                if maint_local:
+                    local_maint_activate = f'wp --path="{self.config["paths"]["local"]}" maintenance-mode activate --allow-root'
+                    self.command_collector.add_command(
+                        local_maint_activate,
+                        "Activate maintenance mode on local WordPress",
+                        "local",
+                        "Local User (root)"
+                    )
                 
-                remote_maint_activate = f'wp --path="{self.config["paths"]["live"]}" maintenance-mode activate --allow-root'
-                self.command_collector.add_command(
-                    remote_maint_activate,
-                    "Activate maintenance mode on remote WordPress",
-                    "remote",
-                    f"{self.config['ssh']['user']}"
-                )
+                if maint_remote:
+                    remote_maint_activate = f'wp --path="{self.config["paths"]["live"]}" maintenance-mode activate --allow-root'
+                    self.command_collector.add_command(
+                        remote_maint_activate,
+                        "Activate maintenance mode on remote WordPress",
+                        "remote",
+                        f"{self.config['ssh']['user']}"
+                    )
                 
                 # Alternative maintenance mode method (creating .maintenance file)
-                local_maint_file = f'echo "<?php $upgrading = time(); ?>" > {os.path.join(self.config["paths"]["local"], ".maintenance")}'
-                self.command_collector.add_command(
-                    local_maint_file,
-                    "Create .maintenance file on local WordPress (alternative method)",
-                    "local",
-                    "Local User"
-                )
+                if maint_local:
+                    local_maint_file = f'echo "<?php $upgrading = time(); ?>" > {os.path.join(self.config["paths"]["local"], ".maintenance")}'
+                    self.command_collector.add_command(
+                        local_maint_file,
+                        "Create .maintenance file on local WordPress (alternative method)",
+                        "local",
+                        "Local User"
+                    )
                 
-                remote_maint_file = f'echo "<?php $upgrading = time(); ?>" > {os.path.join(self.config["paths"]["live"], ".maintenance")}'
-                self.command_collector.add_command(
-                    remote_maint_file,
-                    "Create .maintenance file on remote WordPress (alternative method)",
-                    "remote",
-                    f"{self.config['ssh']['user']}"
-                )
+                if maint_remote:
+                    remote_maint_file = f'echo "<?php $upgrading = time(); ?>" > {os.path.join(self.config["paths"]["live"], ".maintenance")}'
+                    self.command_collector.add_command(
+                        remote_maint_file,
+                        "Create .maintenance file on remote WordPress (alternative method)",
+                        "remote",
+                        f"{self.config['ssh']['user']}"
+                    )
                 
                 # Database commands - skip if files_only
                 if not files_only:
@@ -813,12 +843,16 @@ class WordPressSync:
                     if "backup" in self.config and "database" in self.config["backup"]:
                         backup_enabled = self.config["backup"]["database"].get("enabled", False)
                     
+                    # Extra mysqldump flags; backups keep the excluded tables
+                    export_args = " ".join(self.database_manager.get_export_args())
+                    backup_export_args = " ".join(self.database_manager.get_backup_export_args())
+                    
                     if self.direction == "push":
                         # Export from local
                         local_db_temp = self._resolve_local_db_temp()
                         db_filename = self.config["paths"].get("db_filename", "wordpress-sync-database.sql")
                         db_file = os.path.join(local_db_temp, db_filename)
-                        export_cmd = f'wp --path="{self.config["paths"]["local"]}" db export {db_file} --allow-root'
+                        export_cmd = f'wp --path="{self.config["paths"]["local"]}" db export {db_file} {export_args} --allow-root'
                         self.command_collector.add_command(
                             export_cmd,
                             "Export database from local WordPress",
@@ -826,17 +860,6 @@ class WordPressSync:
                             "Local User (root)"
                         )
                         
-                        # Transfer database file to remote
-                        remote_db_temp = self._resolve_remote_db_temp()
-                        remote_db_file = os.path.join(remote_db_temp, db_filename)
-                        scp_cmd = f'scp -i {self.config["ssh"]["key_path"]} {db_file} {self.config["ssh"]["user"]}@{self.config["ssh"]["host"]}:{remote_db_file}'
-                        self.command_collector.add_command(
-                            scp_cmd,
-                            "Transfer database file to remote server",
-                            "local",
-                            "Local User"
-                        )
-                        
                         # Database backup commands (if enabled)
                         if backup_enabled:
                             # Resolve DB backup directory: new format uses <root>/db/, old uses separate directory
@@ -854,21 +877,12 @@ class WordPressSync:
                             
                             filename_format = self.config["backup"]["database"].get("filename_format", "db-backup_%Y-%m-%d_%H%M%S.sql")
                                 
-                            # Create backup directory
-                            mkdir_cmd = f"mkdir -p {full_backup_dir}"
-                            self.command_collector.add_command(
-                                mkdir_cmd,
-                                "Create database backup directory on remote server",
-                                "remote",
-                                f"{self.config['ssh']['user']}"
-                            )
-                            
                             # Generate timestamp for backup filename
                             timestamp = time.strftime(filename_format.replace(".sql", ""))
                             backup_file = os.path.join(full_backup_dir, f"{timestamp}.sql")
                             
-                            # Backup command
-                            backup_cmd = f'wp --path="{self.config["paths"]["live"]}" db export {backup_file} --allow-root'
+                            # Create backup directory and export in one remote call
+                            backup_cmd = f'mkdir -p "{full_backup_dir}" && wp --path="{self.config["paths"]["live"]}" db export "{backup_file}" {backup_export_args} --allow-root'
                             self.command_collector.add_command(
                                 backup_cmd,
                                 "Backup remote database before reset (optional)",
@@ -885,33 +899,26 @@ class WordPressSync:
                             f"{self.config['ssh']['user']}"
                         )
                         
-                        import_cmd = f'wp --path="{self.config["paths"]["live"]}" db import {remote_db_file} --allow-root'
+                        import_cmd = self.database_manager.get_stream_import_command(
+                            db_file, self.config["paths"]["live"], self.ssh_manager.ssh_argv()
+                        )
                         self.command_collector.add_command(
                             import_cmd,
-                            "Import database to remote WordPress",
-                            "remote",
-                            f"{self.config['ssh']['user']}"
+                            "Stream local database dump into remote WordPress",
+                            "local",
+                            "Local User"
                         )
                     else:  # pull
-                        # Export from remote
-                        remote_db_temp = self._resolve_remote_db_temp()
-                        db_filename = self.config["paths"].get("db_filename", "wordpress-sync-database.sql")
-                        remote_db_file = os.path.join(remote_db_temp, db_filename)
-                        export_cmd = f'wp --path="{self.config["paths"]["live"]}" db export {remote_db_file} --allow-root'
-                        self.command_collector.add_command(
-                            export_cmd,
-                            "Export database from remote WordPress",
-                            "remote",
-                            f"{self.config['ssh']['user']}"
-                        )
-                        
-                        # Transfer database file to local
+                        # Export from remote, streamed straight into the local temp directory
                         local_db_temp = self._resolve_local_db_temp()
+                        db_filename = self.config["paths"].get("db_filename", "wordpress-sync-database.sql")
                         db_file = os.path.join(local_db_temp, db_filename)
-                        scp_cmd = f'scp -i {self.config["ssh"]["key_path"]} {self.config["ssh"]["user"]}@{self.config["ssh"]["host"]}:{remote_db_file} {db_file}'
+                        export_cmd = self.database_manager.get_stream_export_command(
+                            db_file, self.config["paths"]["live"], self.ssh_manager.ssh_argv()
+                        )
                         self.command_collector.add_command(
-                            scp_cmd,
-                            "Transfer database file to local system",
+                            export_cmd,
+                            "Stream database dump from remote WordPress to local system",
                             "local",
                             "Local User"
                         )
@@ -947,7 +954,7 @@ class WordPressSync:
                             backup_file = os.path.join(full_backup_dir, f"{timestamp}.sql")
                             
                             # Backup command
-                            backup_cmd = f'wp --path="{self.config["paths"]["local"]}" db export {backup_file} --allow-root'
+                            backup_cmd = f'wp --path="{self.config["paths"]["local"]}" db export {backup_file} {backup_export_args} --allow-root'
                             self.command_collector.add_command(
                                 backup_cmd,
                                 "Backup local database before reset (optional)",
@@ -977,8 +984,8 @@ class WordPressSync:
                     self.command_collector.set_section("File Transfer")
                     
                     # Build rsync options
-                    rsync_options = self.ssh_manager._build_rsync_options()
-                    rsync_opts_str = " ".join(rsync_options)
+                    rsync_options = self.ssh_manager.get_rsync_options()
+                    rsync_opts_str = shlex.join(rsync_options)
                     
                     # Display rsync options details as a single description
                     rsync_description = f"Using the following rsync options: {rsync_opts_str}\n"
@@ -1003,7 +1010,7 @@ class WordPressSync:
                     live_path = self.config["paths"]["live"] if self.config["paths"]["live"].endswith('/') else f"{self.config['paths']['live']}/"
                     
                     if self.direction == "push":
-                        rsync_cmd = f"rsync {rsync_opts_str} {local_path} {self.config['ssh']['user']}@{self.config['ssh']['host']}:{live_path}"
+                        rsync_cmd = f"rsync {rsync_opts_str} {shlex.quote(local_path)} {shlex.quote(self.config['ssh']['user'] + '@' + self.config['ssh']['host'] + ':' + live_path)}"
                         self.command_collector.add_command(
                             rsync_cmd,
                             "Transfer files from local to remote server",
@@ -1016,7 +1023,7 @@ class WordPressSync:
                             user = self.config["ownership"]["user"]
                             group = self.config["ownership"]["group"]
                             
-                            chown_cmd = f"sudo chown -R {user}:{group} {live_path}"
+                            chown_cmd = f"sudo chown -R {shlex.quote(f'{user}:{group}')} {shlex.quote(live_path)}"
                             self.command_collector.add_command(
                                 chown_cmd,
                                 "Set ownership of files on remote server",
@@ -1024,23 +1031,15 @@ class WordPressSync:
                                 f"{self.config['ssh']['sudo']['user']} (sudo)"
                             )
                             
-                            chmod_dirs_cmd = f"sudo find {live_path} -type d -exec chmod 755 {{}} \\;"
-                            self.command_collector.add_command(
-                                chmod_dirs_cmd,
-                                "Set directory permissions on remote server",
-                                "remote",
-                                f"{self.config['ssh']['sudo']['user']} (sudo)"
-                            )
-                            
-                            chmod_files_cmd = f"sudo find {live_path} -type f -exec chmod 644 {{}} \\;"
+                            chmod_cmd = f"sudo find {shlex.quote(live_path)} -type d -exec chmod 755 {{}} + -o -type f -exec chmod 644 {{}} +"
                             self.command_collector.add_command(
-                                chmod_files_cmd,
-                                "Set file permissions on remote server",
+                                chmod_cmd,
+                                "Set directory and file permissions on remote server",
                                 "remote",
                                 f"{self.config['ssh']['sudo']['user']} (sudo)"
                             )
                     else:  # pull
-                        rsync_cmd = f"rsync {rsync_opts_str} {self.config['ssh']['user']}@{self.config['ssh']['host']}:{live_path} {local_path}"
+                        rsync_cmd = f"rsync {rsync_opts_str} {shlex.quote(self.config['ssh']['user'] + '@' + self.config['ssh']['host'] + ':' + live_path)} {shlex.quote(local_path)}"
                         self.command_collector.add_command(
                             rsync_cmd,
                             "Transfer files from remote to local server",
@@ -1247,21 +1246,23 @@ class WordPressSync:
                 # Maintenance mode deactivation
                 self.command_collector.set_section("Maintenance Mode Deactivation")
                 
-                local_maint_deactivate = f'wp --path="{self.config["paths"]["local"]}" maintenance-mode deactivate --allow-root'
-                self.command_collector.add_command(
-                    local_maint_deactivate,
-                    "Deactivate maintenance mode on local WordPress",
-                    "local",
-                    "Local User (root)"
-                )
+                if maint_local:
+                    local_maint_deactivate = f'wp --path="{self.config["paths"]["local"]}" maintenance-mode deactivate --allow-root'
+                    self.command_collector.add_command(
+                        local_maint_deactivate,
+                        "Deactivate maintenance mode on local WordPress",
+                        "local",
+                        "Local User (root)"
+                    )
                 
-                remote_maint_deactivate = f'wp --path="{self.config["paths"]["live"]}" maintenance-mode deactivate --allow-root'
-                self.command_collector.add_command(
-                    remote_maint_deactivate,
-                    "Deactivate maintenance mode on remote WordPress",
-                    "remote",
-                    f"{self.config['ssh']['user']}"
-                )
+                if maint_remote:
+                    remote_maint_deactivate = f'wp --path="{self.config["paths"]["live"]}" maintenance-mode deactivate --allow-root'
+                    self.command_collector.add_command(
+                        remote_maint_deactivate,
+                        "Deactivate maintenance mode on remote WordPress",
+                        "remote",
+                        f"{self.config['ssh']['user']}"
+                    )
                 
                 # Add verification message
                 self.command_collector.add_command(
@@ -1568,10 +1569,17 @@ class WordPressSync:
         except Exception as e:
             print(f"Unhandled error: {e}")
             return 1
+        finally:
+            # Release the shared SSH master once the last remote call is done
+            if self.ssh_manager:
+                self.ssh_manager.close()
 
 
 def main():
     """Entry point for the wordpress-sync CLI tool."""
+    # Managers that log send plain messages to stdout, in line with their print output
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
+    
     wordpress_sync = WordPressSync()
     sys.exit(wordpress_sync.run())
 